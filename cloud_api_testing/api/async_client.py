@@ -0,0 +1,273 @@
+"""
+Async API client for cloud service testing.
+
+The async transport is deliberately aiohttp. httpx/httpcore's connection
+pool rescans its whole request queue on every state change, which is
+O(n^2) in queued requests and stalls badly at high concurrency, whereas
+aiohttp's TCPConnector hands out connections from per-host waiter queues
+in amortized O(1). Do not swap the backend or hand-roll a pool on top of
+this client.
+"""
+import asyncio
+import logging
+import time
+from typing import Dict, Any, Optional, List, Awaitable
+
+import aiohttp
+
+from cloud_api_testing.api.response import Response
+
+logger = logging.getLogger(__name__)
+
+async def gather_with_concurrency(n: int, *coros: Awaitable) -> List[Any]:
+    """
+    Run coroutines concurrently with at most n in flight at once.
+    
+    Args:
+        n: Maximum number of coroutines running at the same time
+        *coros: Coroutines to run
+    
+    Returns:
+        List: Results in the same order as the coroutines
+    """
+    semaphore = asyncio.Semaphore(n)
+    
+    async def run(coro: Awaitable) -> Any:
+        async with semaphore:
+            return await coro
+    
+    return await asyncio.gather(*(run(coro) for coro in coros))
+
+class AsyncApiClient:
+    """Asynchronous client for making API requests to cloud services."""
+    
+    def __init__(
+        self,
+        base_url: str,
+        auth=None,
+        timeout: int = 30,
+        limit: int = 100,
+        limit_per_host: int = 10
+    ):
+        """
+        Initialize the async API client.
+        
+        Args:
+            base_url: Base URL for API requests
+            auth: Authentication handler (optional)
+            timeout: Request timeout in seconds
+            limit: Maximum number of open connections
+            limit_per_host: Maximum number of open connections per host
+        """
+        self.base_url = base_url.rstrip('/')
+        self.auth = auth
+        self.timeout = timeout
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self._session = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared client session, creating it on first use.
+        
+        Returns:
+            aiohttp.ClientSession: Client session
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+    
+    async def send_request(
+        self,
+        method: str,
+        endpoint: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None
+    ) -> Response:
+        """
+        Send an HTTP request to the API.
+        
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, etc.)
+            endpoint: API endpoint (will be appended to base_url)
+            headers: Request headers
+            params: Query parameters
+            data: Request body (for form data or plain text)
+            json_data: Request body as JSON
+            timeout: Request timeout in seconds (overrides default)
+        
+        Returns:
+            Response: Response model with the body already read
+        
+        Raises:
+            aiohttp.ClientError: If request fails
+        """
+        method = method.upper()
+        url = f"{self.base_url}{endpoint}"
+        
+        request_headers = dict(headers) if headers else {}
+        if self.auth:
+            # Auth handlers are synchronous and may block on a token refresh,
+            # so they run on a worker thread instead of stalling the event loop
+            request_headers.update(
+                await asyncio.to_thread(
+                    self.auth.get_auth_headers, method, url, headers, params, data, json_data
+                )
+            )
+        
+        # Passing timeout=None would disable the session's default timeout
+        request_kwargs = {}
+        if timeout is not None:
+            request_kwargs['timeout'] = aiohttp.ClientTimeout(total=timeout)
+        
+        logger.info("Sending %s request to %s", method, url)
+        
+        session = self._get_session()
+        start_time = time.perf_counter()
+        
+        try:
+            async with session.request(
+                method,
+                url,
+                headers=request_headers,
+                params=params,
+                data=data,
+                json=json_data,
+                **request_kwargs
+            ) as resp:
+                content = await resp.read()
+                elapsed_time = time.perf_counter() - start_time
+                
+                logger.info("Received response: %s", resp.status)
+                
+                return Response(
+                    status_code=resp.status,
+                    headers=dict(resp.headers),
+                    content=content,
+                    elapsed_time=elapsed_time,
+                    request_info={
+                        'method': method,
+                        'url': str(resp.url),
+                        'headers': request_headers
+                    }
+                )
+        
+        except aiohttp.ClientError as e:
+            logger.error("Request failed: %s", e)
+            raise
+    
+    async def get(self, endpoint: str, **kwargs) -> Response:
+        """
+        Send a GET request.
+        
+        Args:
+            endpoint: API endpoint
+            **kwargs: Additional arguments for send_request
+        
+        Returns:
+            Response: Response model
+        """
+        return await self.send_request('GET', endpoint, **kwargs)
+    
+    async def post(self, endpoint: str, **kwargs) -> Response:
+        """
+        Send a POST request.
+        
+        Args:
+            endpoint: API endpoint
+            **kwargs: Additional arguments for send_request
+        
+        Returns:
+            Response: Response model
+        """
+        return await self.send_request('POST', endpoint, **kwargs)
+    
+    async def put(self, endpoint: str, **kwargs) -> Response:
+        """
+        Send a PUT request.
+        
+        Args:
+            endpoint: API endpoint
+            **kwargs: Additional arguments for send_request
+        
+        Returns:
+            Response: Response model
+        """
+        return await self.send_request('PUT', endpoint, **kwargs)
+    
+    async def delete(self, endpoint: str, **kwargs) -> Response:
+        """
+        Send a DELETE request.
+        
+        Args:
+            endpoint: API endpoint
+            **kwargs: Additional arguments for send_request
+        
+        Returns:
+            Response: Response model
+        """
+        return await self.send_request('DELETE', endpoint, **kwargs)
+    
+    async def patch(self, endpoint: str, **kwargs) -> Response:
+        """
+        Send a PATCH request.
+        
+        Args:
+            endpoint: API endpoint
+            **kwargs: Additional arguments for send_request
+        
+        Returns:
+            Response: Response model
+        """
+        return await self.send_request('PATCH', endpoint, **kwargs)
+    
+    async def head(self, endpoint: str, **kwargs) -> Response:
+        """
+        Send a HEAD request.
+        
+        Args:
+            endpoint: API endpoint
+            **kwargs: Additional arguments for send_request
+        
+        Returns:
+            Response: Response model
+        """
+        return await self.send_request('HEAD', endpoint, **kwargs)
+    
+    async def options(self, endpoint: str, **kwargs) -> Response:
+        """
+        Send an OPTIONS request.
+        
+        Args:
+            endpoint: API endpoint
+            **kwargs: Additional arguments for send_request
+        
+        Returns:
+            Response: Response model
+        """
+        return await self.send_request('OPTIONS', endpoint, **kwargs)
+    
+    async def close(self):
+        """Close the session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        logger.info("Async API client session closed")
+    
+    async def __aenter__(self) -> 'AsyncApiClient':
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
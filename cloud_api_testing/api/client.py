@@ -1,15 +1,62 @@
 """
 API client for cloud service testing.
 """
+import functools
 import requests
 import logging
 import json
 from typing import Dict, Any, Optional, Union
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+def create_session(
+    pool_connections: int = 20,
+    pool_maxsize: int = 100,
+    max_retries: Optional[Union[int, Retry]] = None
+) -> requests.Session:
+    """
+    Create a requests session with a tuned, shared connection pool.
+    
+    Args:
+        pool_connections: Number of per-host connection pools to cache
+        pool_maxsize: Maximum number of connections kept alive per host
+        max_retries: Retry policy for the transport (default: retry
+            connection errors only, so response status codes reach the caller)
+        
+    Returns:
+        requests.Session: Configured session
+    """
+    if max_retries is None:
+        max_retries = Retry(connect=3, read=0, backoff_factor=0.3)
+    
+    # Share one tuned connection pool across http and https
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=False,
+        max_retries=max_retries
+    )
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['Connection'] = 'keep-alive'
+    return session
 
 class ApiClient:
     """Client for making API requests to cloud services."""
     
-    def __init__(self, base_url: str, auth=None, timeout: int = 30):
+    def __init__(
+        self,
+        base_url: str,
+        auth=None,
+        timeout: int = 30,
+        pool_connections: int = 20,
+        pool_maxsize: int = 100,
+        max_retries: Optional[Union[int, Retry]] = None,
+        session: Optional[requests.Session] = None
+    ):
         """
         Initialize the API client.
         
@@ -17,12 +64,32 @@ class ApiClient:
             base_url: Base URL for API requests
             auth: Authentication handler (optional)
             timeout: Request timeout in seconds
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum number of connections kept alive per host
+            max_retries: Retry policy for the transport (default: retry
+                connection errors only, so response status codes reach the caller)
+            session: Shared session to send requests through (optional). The
+                pool settings are ignored and close() leaves it open.
         """
         self.base_url = base_url.rstrip('/')
         self.auth = auth
         self.timeout = timeout
-        self.session = requests.Session()
-        self.logger = logging.getLogger(__name__)
+        
+        self._owns_session = session is None
+        if session is None:
+            session = create_session(pool_connections, pool_maxsize, max_retries)
+        self.session = session
+        
+        # Bound session methods for the common verbs. HEAD is left out on
+        # purpose: Session.head() disables redirects, Session.request() doesn't.
+        self._dispatch = {
+            'GET': self.session.get,
+            'POST': self.session.post,
+            'PUT': self.session.put,
+            'DELETE': self.session.delete,
+            'PATCH': self.session.patch,
+            'OPTIONS': self.session.options
+        }
     
     def send_request(
         self, 
@@ -54,6 +121,12 @@ class ApiClient:
         Raises:
             requests.RequestException: If request fails
         """
+        # Only pay for debug formatting (and body decoding) when DEBUG is on
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        
+        # Normalize method once (also what request signing must see)
+        method = method if method.isupper() else method.upper()
+        
         # Prepare request URL
         url = f"{self.base_url}{endpoint}"
         
@@ -61,34 +134,33 @@ class ApiClient:
         if timeout is None:
             timeout = self.timeout
         
-        # Prepare request headers
-        request_headers = {}
-        if headers:
-            request_headers.update(headers)
-        
-        # Apply authentication if provided
-        auth_headers = {}
+        # Prepare request headers, applying authentication if provided
         if self.auth:
             auth_headers = self.auth.get_auth_headers(method, url, headers, params, data, json_data)
-            request_headers.update(auth_headers)
+            request_headers = {**(headers or {}), **auth_headers}
+        else:
+            request_headers = dict(headers) if headers else {}
         
         # Log request details
-        self.logger.info(f"Sending {method} request to {url}")
-        self.logger.debug(f"Headers: {request_headers}")
-        if params:
-            self.logger.debug(f"Params: {params}")
-        if data:
-            self.logger.debug(f"Data: {data}")
-        if json_data:
-            self.logger.debug(f"JSON: {json_data}")
-        if files:
-            self.logger.debug(f"Files: {list(files.keys())}")
+        logger.info("Sending %s request to %s", method, url)
+        if debug_enabled:
+            logger.debug("Headers: %s", request_headers)
+            if params:
+                logger.debug("Params: %s", params)
+            if data:
+                logger.debug("Data: %s", data)
+            if json_data:
+                logger.debug("JSON: %s", json_data)
+            if files:
+                logger.debug("Files: %s", list(files.keys()))
         
         try:
             # Send request
-            response = self.session.request(
-                method=method.upper(),
-                url=url,
+            send = self._dispatch.get(method)
+            if send is None:
+                send = functools.partial(self.session.request, method)
+            response = send(
+                url,
                 headers=request_headers,
                 params=params,
                 data=data,
@@ -98,23 +170,30 @@ class ApiClient:
             )
             
             # Log response details
-            self.logger.info(f"Received response: {response.status_code}")
-            self.logger.debug(f"Response headers: {response.headers}")
-            
-            # Try to log response body if not too large
-            try:
-                if len(response.content) < 10000:  # Only log if less than 10KB
-                    if 'application/json' in response.headers.get('Content-Type', ''):
-                        self.logger.debug(f"Response JSON: {response.json()}")
+            logger.info("Received response: %s", response.status_code)
+            if debug_enabled:
+                logger.debug("Response headers: %s", response.headers)
+                
+                # Try to log response body if not too large, checking
+                # Content-Length first so large bodies are never materialized
+                try:
+                    content_length = response.headers.get('Content-Length')
+                    if content_length and content_length.isdigit():
+                        small_enough = int(content_length) < 10000
                     else:
-                        self.logger.debug(f"Response text: {response.text}")
-            except Exception as e:
-                self.logger.debug(f"Could not log response content: {str(e)}")
+                        small_enough = len(response.content) < 10000
+                    if small_enough:  # Only log if less than 10KB
+                        if 'application/json' in response.headers.get('Content-Type', ''):
+                            logger.debug("Response JSON: %s", response.json())
+                        else:
+                            logger.debug("Response text: %s", response.text)
+                except Exception as e:
+                    logger.debug("Could not log response content: %s", e)
             
             return response
         
         except requests.RequestException as e:
-            self.logger.error(f"Request failed: {str(e)}")
+            logger.error("Request failed: %s", e)
             raise
     
     def get(self, endpoint: str, **kwargs) -> requests.Response:
@@ -209,6 +288,7 @@ class ApiClient:
         return self.send_request('OPTIONS', endpoint, **kwargs)
     
     def close(self):
-        """Close the session."""
-        self.session.close()
-        self.logger.info("API client session closed")
+        """Close the session (unless it is shared and owned by the caller)."""
+        if self._owns_session:
+            self.session.close()
+        logger.info("API client session closed")
@@ -2,7 +2,8 @@
 API request model for cloud service testing.
 """
 from typing import Dict, Any, Optional, Union
-import json
+
+from cloud_api_testing.api.response import _dumps_pretty
 
 class Request:
     """Model representing an API request."""
@@ -126,7 +127,7 @@ class Request:
         Returns:
             str: Request as string
         """
-        return json.dumps(self.to_dict(), indent=2)
+        return _dumps_pretty(self.to_dict())
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Request':
@@ -4,6 +4,20 @@ API response model for cloud service testing.
 from typing import Dict, Any, Optional, Union
 import json
 import requests
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import orjson
+    _loads = orjson.loads
+    
+    def _dumps_pretty(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+except ImportError:
+    def _loads(content: bytes) -> Any:
+        return json.loads(content.decode('utf-8'))
+    
+    def _dumps_pretty(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
 
 class Response:
     """Model representing an API response."""
@@ -12,9 +26,10 @@ class Response:
         self,
         status_code: int,
         headers: Dict[str, str],
-        content: bytes,
+        content: Optional[bytes],
         elapsed_time: float,
-        request_info: Optional[Dict[str, Any]] = None
+        request_info: Optional[Dict[str, Any]] = None,
+        raw_response: Optional[requests.Response] = None
     ):
         """
         Initialize the response model.
@@ -22,18 +37,61 @@ class Response:
         Args:
             status_code: HTTP status code
             headers: Response headers
-            content: Response content as bytes
+            content: Response content as bytes (None to read it lazily from raw_response)
             elapsed_time: Request-response time in seconds
             request_info: Information about the request that generated this response
+            raw_response: Underlying requests.Response to read content from on first access
         """
         self.status_code = status_code
         self.headers = headers
-        self.content = content
+        self._content = content
+        self._raw_response = raw_response
         self.elapsed_time = elapsed_time
         self.request_info = request_info or {}
         self._json = None
         self._text = None
     
+    @property
+    def headers(self) -> CaseInsensitiveDict:
+        """
+        Get response headers.
+        
+        Returns:
+            CaseInsensitiveDict: Response headers with O(1) case-insensitive lookup
+        """
+        return self._headers
+    
+    @headers.setter
+    def headers(self, value: Dict[str, str]):
+        # Keep lookups case-insensitive even when headers are reassigned
+        self._headers = CaseInsensitiveDict(value)
+    
+    @property
+    def content(self) -> bytes:
+        """
+        Get response content as bytes.
+        
+        The body is only pulled from the underlying response on first access,
+        so status/header-only checks never materialize it.
+        
+        Returns:
+            bytes: Response content
+        """
+        if self._content is None:
+            if self._raw_response is not None:
+                self._content = self._raw_response.content
+                self._raw_response = None
+            else:
+                self._content = b''
+        return self._content
+    
+    @content.setter
+    def content(self, value: bytes):
+        self._content = value
+        self._raw_response = None
+        self._json = None
+        self._text = None
+    
     @property
     def text(self) -> str:
         """
@@ -59,8 +117,8 @@ class Response:
         """
         if self._json is None:
             try:
-                self._json = json.loads(self.text)
-            except json.JSONDecodeError as e:
+                self._json = _loads(self.content)
+            except ValueError as e:
                 raise ValueError(f"Response is not valid JSON: {str(e)}")
         return self._json
     
@@ -111,10 +169,7 @@ class Response:
         Returns:
             str or None: Header value or default
         """
-        for key, value in self.headers.items():
-            if key.lower() == name.lower():
-                return value
-        return default
+        return self.headers.get(name, default)
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -150,7 +205,7 @@ class Response:
         Returns:
             str: Response as string
         """
-        return json.dumps(self.to_dict(), indent=2)
+        return _dumps_pretty(self.to_dict())
     
     @classmethod
     def from_requests_response(cls, response: requests.Response) -> 'Response':
@@ -171,8 +226,9 @@ class Response:
         
         return cls(
             status_code=response.status_code,
-            headers=dict(response.headers),
-            content=response.content,
+            headers=response.headers,
+            content=None,
             elapsed_time=response.elapsed.total_seconds(),
-            request_info=request_info
+            request_info=request_info,
+            raw_response=response
         )
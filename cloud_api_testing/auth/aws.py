@@ -3,9 +3,22 @@ AWS authentication for cloud API testing.
 """
 import hmac
 import hashlib
-import datetime
+import json
 import logging
-from typing import Dict, Any, Optional
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, Tuple, List, Union
+from urllib.parse import urlparse, quote, urlencode
+
+logger = logging.getLogger(__name__)
+
+# Characters left unescaped by SigV4 URI encoding
+_SAFE = '-_.~'
+
+# SHA256 of an empty payload (GET/HEAD/DELETE without a body)
+_EMPTY_SHA256 = hashlib.sha256(b'').hexdigest()
+
+# Maximum number of header name layouts remembered per AwsAuth instance
+_MAX_HEADER_LAYOUTS = 128
 
 class AwsAuth:
     """Authentication handler for AWS API requests."""
@@ -24,14 +37,19 @@ class AwsAuth:
         self.secret_key = secret_key
         self.region = region
         self.service = service
-        self.logger = logging.getLogger(__name__)
+        self._signing_key_cache: Dict[Tuple[str, str, str], bytes] = {}
+        self._credential_scope_cache: Dict[Tuple[str, str, str], str] = {}
+        # Date stamp of the entries in the two caches above
+        self._cache_date: Optional[str] = None
+        # Header names -> canonical name order around x-amz-date and signed headers string
+        self._header_layout_cache: Dict[Tuple[str, ...], Optional[Tuple]] = {}
     
     def get_auth_headers(
         self,
         method: str,
         url: str,
         headers: Optional[Dict[str, str]] = None,
-        params: Optional[Dict[str, Any]] = None,
+        params: Optional[Union[Dict[str, Any], List[Tuple[str, Any]]]] = None,
         data: Optional[Any] = None,
         json_data: Optional[Dict[str, Any]] = None
     ) -> Dict[str, str]:
@@ -42,7 +60,7 @@ class AwsAuth:
             method: HTTP method
             url: Request URL
             headers: Request headers
-            params: Query parameters
+            params: Query parameters (dict or list of key/value tuples)
             data: Request body
             json_data: Request body as JSON
             
@@ -53,9 +71,12 @@ class AwsAuth:
         headers = headers.copy() if headers else {}
         
         # Get current timestamp
-        now = datetime.datetime.utcnow()
+        now = datetime.now(timezone.utc)
         amz_date = now.strftime('%Y%m%dT%H%M%SZ')
-        date_stamp = now.strftime('%Y%m%d')
+        date_stamp = amz_date[:8]
+        
+        # Create canonical headers from the caller's headers plus the date
+        canonical_headers, signed_headers = self._build_header_strings(headers, amz_date)
         
         # Add required headers
         headers['X-Amz-Date'] = amz_date
@@ -63,8 +84,6 @@ class AwsAuth:
         # Create canonical request
         canonical_uri = self._get_canonical_uri(url)
         canonical_querystring = self._get_canonical_querystring(params)
-        canonical_headers = self._get_canonical_headers(headers)
-        signed_headers = self._get_signed_headers(headers)
         
         # Create payload hash
         payload_hash = self._get_payload_hash(data, json_data)
@@ -74,11 +93,23 @@ class AwsAuth:
         
         # Create string to sign
         algorithm = 'AWS4-HMAC-SHA256'
-        credential_scope = f"{date_stamp}/{self.region}/{self.service}/aws4_request"
+        scope_key = (date_stamp, self.region, self.service)
+        credential_scope = self._credential_scope_cache.get(scope_key)
+        if credential_scope is None:
+            if date_stamp != self._cache_date:
+                # Scopes and signing keys are only valid for one day, so keep only today's
+                self._signing_key_cache.clear()
+                self._credential_scope_cache.clear()
+                self._cache_date = date_stamp
+            credential_scope = f"{date_stamp}/{self.region}/{self.service}/aws4_request"
+            self._credential_scope_cache[scope_key] = credential_scope
         string_to_sign = f"{algorithm}\n{amz_date}\n{credential_scope}\n{self._hash_sha256(canonical_request)}"
         
-        # Calculate signature
-        signing_key = self._get_signature_key(self.secret_key, date_stamp, self.region, self.service)
+        # Calculate signature (the signing key only changes once per day)
+        signing_key = self._signing_key_cache.get(scope_key)
+        if signing_key is None:
+            signing_key = self._get_signature_key(self.secret_key, date_stamp, self.region, self.service)
+            self._signing_key_cache[scope_key] = signing_key
         signature = hmac.new(signing_key, string_to_sign.encode('utf-8'), hashlib.sha256).hexdigest()
         
         # Add authorization header
@@ -91,7 +122,8 @@ class AwsAuth:
         
         headers['Authorization'] = auth_header
         
-        self.logger.debug(f"Generated AWS auth headers for {method} {url}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Generated AWS auth headers for %s %s", method, url)
         return headers
     
     def _hash_sha256(self, data: str) -> str:
@@ -117,7 +149,6 @@ class AwsAuth:
             str: Canonical URI
         """
         # Extract path from URL
-        from urllib.parse import urlparse
         parsed_url = urlparse(url)
         path = parsed_url.path
         
@@ -131,12 +162,15 @@ class AwsAuth:
         
         return path
     
-    def _get_canonical_querystring(self, params: Optional[Dict[str, Any]] = None) -> str:
+    def _get_canonical_querystring(
+        self,
+        params: Optional[Union[Dict[str, Any], List[Tuple[str, Any]]]] = None
+    ) -> str:
         """
         Get canonical query string from parameters.
         
         Args:
-            params: Query parameters
+            params: Query parameters (dict or list of key/value tuples)
             
         Returns:
             str: Canonical query string
@@ -144,54 +178,75 @@ class AwsAuth:
         if not params:
             return ''
         
-        # Sort parameters by key
-        sorted_params = sorted(params.items())
-        
-        # URL encode parameters
-        from urllib.parse import quote
-        encoded_params = []
-        for key, value in sorted_params:
-            encoded_key = quote(str(key), safe='-_.~')
-            encoded_value = quote(str(value), safe='-_.~')
-            encoded_params.append(f"{encoded_key}={encoded_value}")
-        
-        return '&'.join(encoded_params)
+        # Sort parameters by key and URL encode them
+        items = params.items() if isinstance(params, dict) else params
+        return urlencode(sorted(items), quote_via=quote, safe=_SAFE)
     
-    def _get_canonical_headers(self, headers: Dict[str, str]) -> str:
+    def _build_header_strings(self, headers: Dict[str, str], amz_date: str) -> Tuple[str, str]:
         """
-        Get canonical headers string.
+        Get canonical headers and signed headers strings, including X-Amz-Date.
+        
+        The sorted order of the caller's header names is remembered, so
+        re-signing requests with the same header names only fills in the
+        current values and date. Header values are never cached.
         
         Args:
-            headers: Request headers
+            headers: Request headers (without X-Amz-Date)
+            amz_date: Request timestamp in AWS format
             
         Returns:
-            str: Canonical headers string
+            Tuple: Canonical headers string and signed headers string
         """
-        # Convert header names to lowercase and sort by name
-        canonical_headers = {}
-        for key, value in headers.items():
-            canonical_headers[key.lower()] = value.strip()
+        names = tuple(headers)
+        try:
+            layout = self._header_layout_cache[names]
+        except KeyError:
+            layout = self._header_layout(names)
+            if len(self._header_layout_cache) >= _MAX_HEADER_LAYOUTS:
+                self._header_layout_cache.clear()
+            self._header_layout_cache[names] = layout
         
-        # Create canonical headers string
-        header_strings = []
-        for key in sorted(canonical_headers.keys()):
-            header_strings.append(f"{key}:{canonical_headers[key]}")
+        if layout is None:
+            # Names differing only in case sort by value, so build from scratch
+            canonical = sorted(
+                (key.lower(), value.strip()) for key, value in headers.items() if key.lower() != 'x-amz-date'
+            )
+            before = ''.join(f"{key}:{value}\n" for key, value in canonical if key < 'x-amz-date')
+            after = ''.join(f"{key}:{value}\n" for key, value in canonical if key > 'x-amz-date')
+            signed_headers = ';'.join(sorted([key for key, _ in canonical] + ['x-amz-date']))
+        else:
+            before_names, after_names, signed_headers = layout
+            before = ''.join(f"{lower}:{headers[name].strip()}\n" for name, lower in before_names)
+            after = ''.join(f"{lower}:{headers[name].strip()}\n" for name, lower in after_names)
         
-        return '\n'.join(header_strings) + '\n'
+        return f"{before}x-amz-date:{amz_date}\n{after}", signed_headers
     
-    def _get_signed_headers(self, headers: Dict[str, str]) -> str:
+    def _header_layout(
+        self,
+        names: Tuple[str, ...]
+    ) -> Optional[Tuple[Tuple[Tuple[str, str], ...], Tuple[Tuple[str, str], ...], str]]:
         """
-        Get signed headers string.
+        Get the canonical order of header names around x-amz-date.
         
         Args:
-            headers: Request headers
+            names: Request header names, excluding the per-request X-Amz-Date
             
         Returns:
-            str: Signed headers string
+            Tuple or None: (name, lowercase name) pairs sorting before x-amz-date,
+                pairs sorting after it, and the signed headers string; None if
+                two names only differ in case
         """
         # Convert header names to lowercase and sort by name
-        header_names = [key.lower() for key in headers.keys()]
-        return ';'.join(sorted(header_names))
+        canonical = sorted((name.lower(), name) for name in names if name.lower() != 'x-amz-date')
+        lower_names = [lower for lower, _ in canonical]
+        if len(set(lower_names)) != len(lower_names):
+            return None
+        
+        before = tuple((name, lower) for lower, name in canonical if lower < 'x-amz-date')
+        after = tuple((name, lower) for lower, name in canonical if lower > 'x-amz-date')
+        signed_headers = ';'.join(sorted(lower_names + ['x-amz-date']))
+        
+        return before, after, signed_headers
     
     def _get_payload_hash(self, data: Optional[Any], json_data: Optional[Dict[str, Any]]) -> str:
         """
@@ -204,16 +259,18 @@ class AwsAuth:
         Returns:
             str: Payload hash
         """
-        import json
-        
         if json_data is not None:
-            payload = json.dumps(json_data)
+            # Must serialize exactly as requests does for the request body
+            payload = json.dumps(json_data).encode('utf-8')
         elif data is not None:
-            payload = data if isinstance(data, str) else str(data)
+            if isinstance(data, bytes):
+                payload = data
+            else:
+                payload = (data if isinstance(data, str) else str(data)).encode('utf-8')
         else:
-            payload = ''
+            return _EMPTY_SHA256
         
-        return self._hash_sha256(payload)
+        return hashlib.sha256(payload).hexdigest()
     
     def _get_signature_key(self, key: str, date_stamp: str, region_name: str, service_name: str) -> bytes:
         """
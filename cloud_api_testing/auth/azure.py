@@ -2,10 +2,13 @@
 Azure authentication for cloud API testing.
 """
 import logging
+import threading
 import time
 import requests
 from typing import Dict, Any, Optional
 
+logger = logging.getLogger(__name__)
+
 class AzureAuth:
     """Authentication handler for Azure API requests."""
     
@@ -29,9 +32,11 @@ class AzureAuth:
         self.client_id = client_id
         self.client_secret = client_secret
         self.resource = resource or 'https://management.azure.com/'
-        self.logger = logging.getLogger(__name__)
         self._token = None
         self._token_expiry = 0
+        self._auth_header = None
+        self._token_session = requests.Session()
+        self._refresh_lock = threading.Lock()
     
     def get_auth_headers(
         self,
@@ -59,19 +64,23 @@ class AzureAuth:
         # Create a copy of headers to avoid modifying the original
         headers = headers.copy() if headers else {}
         
-        # Get access token
-        token = self._get_access_token()
+        # Refresh access token if needed
+        self._get_access_token()
         
         # Add authorization header
-        headers['Authorization'] = f"Bearer {token}"
+        headers['Authorization'] = self._auth_header
         
-        self.logger.debug(f"Generated Azure auth headers for {method} {url}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Generated Azure auth headers for %s %s", method, url)
         return headers
     
     def _get_access_token(self) -> str:
         """
         Get Azure AD access token.
         
+        Safe to call from several threads: only one of them refreshes an
+        expired token while the others wait for it.
+        
         Returns:
             str: Access token
             
@@ -83,31 +92,45 @@ class AzureAuth:
         if self._token and current_time < self._token_expiry - 60:  # 60 seconds buffer
             return self._token
         
-        # Token is expired or not acquired yet, get a new one
-        self.logger.info("Acquiring new Azure access token")
-        
-        # Prepare token request
-        token_url = f"https://login.microsoftonline.com/{self.tenant_id}/oauth2/token"
-        token_data = {
-            'grant_type': 'client_credentials',
-            'client_id': self.client_id,
-            'client_secret': self.client_secret,
-            'resource': self.resource
-        }
-        
-        try:
-            # Send token request
-            response = requests.post(token_url, data=token_data)
-            response.raise_for_status()
+        with self._refresh_lock:
+            # Another thread may have refreshed the token while we waited
+            current_time = time.time()
+            if self._token and current_time < self._token_expiry - 60:
+                return self._token
             
-            # Parse response
-            token_response = response.json()
-            self._token = token_response['access_token']
-            self._token_expiry = current_time + token_response['expires_in']
+            # Token is expired or not acquired yet, get a new one
+            logger.info("Acquiring new Azure access token")
             
-            self.logger.info("Successfully acquired Azure access token")
-            return self._token
-        
-        except Exception as e:
-            self.logger.error(f"Failed to acquire Azure access token: {str(e)}")
-            raise
+            # Prepare token request
+            token_url = f"https://login.microsoftonline.com/{self.tenant_id}/oauth2/token"
+            token_data = {
+                'grant_type': 'client_credentials',
+                'client_id': self.client_id,
+                'client_secret': self.client_secret,
+                'resource': self.resource
+            }
+            
+            try:
+                # Send token request
+                response = self._token_session.post(token_url, data=token_data)
+                response.raise_for_status()
+                
+                # Parse response
+                token_response = response.json()
+                token = token_response['access_token']
+                # Publish the header before the token and expiry: readers skip the
+                # lock once those look valid, so the header must already be in place
+                self._auth_header = f"Bearer {token}"
+                self._token = token
+                self._token_expiry = current_time + token_response['expires_in']
+                
+                logger.info("Successfully acquired Azure access token")
+                return self._token
+            
+            except Exception as e:
+                logger.error("Failed to acquire Azure access token: %s", e)
+                raise
+    
+    def close(self):
+        """Close the token endpoint session."""
+        self._token_session.close()
@@ -2,10 +2,56 @@
 GCP authentication for cloud API testing.
 """
 import logging
+import threading
 import time
 import json
 import requests
+from time import monotonic as _monotonic
+import jwt
 from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    _dumps_claims = orjson.dumps
+except ImportError:
+    def _dumps_claims(claims: Dict[str, Any]) -> bytes:
+        return json.dumps(claims, separators=(',', ':')).encode('utf-8')
+
+# OAuth token endpoint, also the JWT audience
+_TOKEN_URL = 'https://oauth2.googleapis.com/token'
+
+# Connect/read timeouts for token requests
+_TOKEN_TIMEOUT = (3.05, 10)
+
+# Shared session for the OAuth token endpoint so refreshes reuse connections,
+# retrying transient 5xx responses from the token endpoint with backoff
+_TOKEN_SESSION = requests.Session()
+_TOKEN_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=['POST']
+    )
+))
+
+def get_token_session() -> requests.Session:
+    """
+    Get the session used for GCP token requests.
+    
+    Callers can mount their own adapters (e.g. with retries) on it.
+    
+    Returns:
+        requests.Session: Token endpoint session
+    """
+    return _TOKEN_SESSION
 
 class GcpAuth:
     """Authentication handler for Google Cloud Platform API requests."""
@@ -24,8 +70,6 @@ class GcpAuth:
             service_account_file: Path to service account key file
             scopes: OAuth scopes to request (default: cloud-platform)
         """
-        self.logger = logging.getLogger(__name__)
-        
         if service_account_key:
             self.service_account_key = service_account_key
         elif service_account_file:
@@ -35,8 +79,21 @@ class GcpAuth:
             raise ValueError("Either service_account_key or service_account_file must be provided")
         
         self.scopes = scopes or ['https://www.googleapis.com/auth/cloud-platform']
+        
+        # Claim fields that never change between token refreshes
+        self._iss = self.service_account_key['client_email']
+        self._scope_str = ' '.join(self.scopes)
+        
+        # Parse the private key once; loading PEM runs an expensive RSA key check
+        self._private_key = load_pem_private_key(
+            self.service_account_key['private_key'].encode('utf-8'),
+            password=None
+        )
         self._token = None
-        self._token_expiry = 0
+        # Monotonic deadline after which the token is refreshed (expiry minus buffer)
+        self._token_expiry_mono = 0
+        self._auth_header = None
+        self._refresh_lock = threading.Lock()
     
     def get_auth_headers(
         self,
@@ -59,24 +116,23 @@ class GcpAuth:
             json_data: Request body as JSON
             
         Returns:
-            Dict: Authentication headers
+            Dict: Authentication headers only (callers merge them into the
+                request headers, so the request headers are not copied)
         """
-        # Create a copy of headers to avoid modifying the original
-        headers = headers.copy() if headers else {}
-        
-        # Get access token
-        token = self._get_access_token()
-        
-        # Add authorization header
-        headers['Authorization'] = f"Bearer {token}"
+        # Refresh access token if needed
+        self._get_access_token()
         
-        self.logger.debug(f"Generated GCP auth headers for {method} {url}")
-        return headers
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Generated GCP auth headers for %s %s", method, url)
+        return {'Authorization': self._auth_header}
     
     def _get_access_token(self) -> str:
         """
         Get GCP access token.
         
+        Safe to call from several threads: only one of them refreshes an
+        expired token while the others wait for it.
+        
         Returns:
             str: Access token
             
@@ -84,55 +140,65 @@ class GcpAuth:
             Exception: If token acquisition fails
         """
         # Check if we have a valid token
-        current_time = time.time()
-        if self._token and current_time < self._token_expiry - 60:  # 60 seconds buffer
-            return self._token
-        
-        # Token is expired or not acquired yet, get a new one
-        self.logger.info("Acquiring new GCP access token")
+        token = self._token
+        if token and _monotonic() < self._token_expiry_mono:
+            return token
         
-        try:
-            # Prepare JWT claim set
-            iat = int(time.time())
-            exp = iat + 3600  # 1 hour expiry
+        with self._refresh_lock:
+            # Another thread may have refreshed the token while we waited
+            token = self._token
+            if token and _monotonic() < self._token_expiry_mono:
+                return token
             
-            claim_set = {
-                'iss': self.service_account_key['client_email'],
-                'scope': ' '.join(self.scopes),
-                'aud': 'https://oauth2.googleapis.com/token',
-                'exp': exp,
-                'iat': iat
-            }
+            # Token is expired or not acquired yet, get a new one
+            logger.info("Acquiring new GCP access token")
             
-            # Create JWT
-            import jwt
+            try:
+                current_time = time.time()
+                current_mono = _monotonic()
+                
+                # Prepare JWT claim set
+                iat = int(current_time)
+                exp = iat + 3600  # 1 hour expiry
+                
+                claim_set = {
+                    'iss': self._iss,
+                    'scope': self._scope_str,
+                    'aud': _TOKEN_URL,
+                    'exp': exp,
+                    'iat': iat
+                }
+                
+                # Create JWT: sign the pre-serialized claims directly at the JWS layer
+                # with the pre-parsed private key (skips jwt.encode's own JSON round-trip)
+                signed_jwt = jwt.api_jws.encode(
+                    _dumps_claims(claim_set),
+                    self._private_key,
+                    algorithm='RS256'
+                )
+                
+                # Exchange JWT for access token
+                token_data = {
+                    'grant_type': 'urn:ietf:params:oauth:grant-type:jwt-bearer',
+                    'assertion': signed_jwt
+                }
+                
+                response = _TOKEN_SESSION.post(_TOKEN_URL, data=token_data, timeout=_TOKEN_TIMEOUT)
+                response.raise_for_status()
+                
+                # Parse response
+                token_response = response.json()
+                token = token_response['access_token']
+                expires_in = token_response['expires_in']
+                # Publish the header before the token and expiry: readers skip the
+                # lock once those look valid, so the header must already be in place
+                self._auth_header = f"Bearer {token}"
+                self._token = token
+                self._token_expiry_mono = current_mono + expires_in - 60  # 60 seconds buffer
+                
+                logger.info("Successfully acquired GCP access token")
+                return self._token
             
-            # Sign JWT with private key
-            private_key = self.service_account_key['private_key']
-            signed_jwt = jwt.encode(
-                claim_set,
-                private_key,
-                algorithm='RS256'
-            )
-            
-            # Exchange JWT for access token
-            token_url = 'https://oauth2.googleapis.com/token'
-            token_data = {
-                'grant_type': 'urn:ietf:params:oauth:grant-type:jwt-bearer',
-                'assertion': signed_jwt
-            }
-            
-            response = requests.post(token_url, data=token_data)
-            response.raise_for_status()
-            
-            # Parse response
-            token_response = response.json()
-            self._token = token_response['access_token']
-            self._token_expiry = current_time + token_response['expires_in']
-            
-            self.logger.info("Successfully acquired GCP access token")
-            return self._token
-        
-        except Exception as e:
-            self.logger.error(f"Failed to acquire GCP access token: {str(e)}")
-            raise
+            except Exception as e:
+                logger.error("Failed to acquire GCP access token: %s", e)
+                raise
@@ -4,8 +4,9 @@ AWS cloud service client for API testing.
 import logging
 from typing import Dict, Any, Optional, List, Union
 
-from cloud_api_testing.api.client import ApiClient
+from cloud_api_testing.api.client import ApiClient, create_session
 from cloud_api_testing.auth.aws import AwsAuth
+from cloud_api_testing.cloud.common import run_concurrently
 
 class AwsClient:
     """Client for testing AWS cloud services."""
@@ -32,6 +33,9 @@ class AwsClient:
         self.default_service = service
         self.logger = logging.getLogger(__name__)
         self.clients = {}
+        
+        # One connection pool shared by every per-service API client
+        self._session = create_session(pool_maxsize=20)
     
     def get_client(self, service: str) -> ApiClient:
         """
@@ -62,12 +66,12 @@ class AwsClient:
         )
         
         # Create API client
-        client = ApiClient(base_url=base_url, auth=auth)
+        client = ApiClient(base_url=base_url, auth=auth, session=self._session)
         
         # Cache client
         self.clients[service] = client
         
-        self.logger.info(f"Created AWS client for {service} in {self.region}")
+        self.logger.info("Created AWS client for %s in %s", service, self.region)
         return client
     
     def s3_list_buckets(self) -> Dict[str, Any]:
@@ -106,11 +110,10 @@ class AwsClient:
         """
         client = self.get_client('s3')
         
-        params = {}
         if prefix:
-            params['prefix'] = prefix
-        
-        response = client.get(f"/{bucket}", params=params)
+            response = client.get(f"/{bucket}", params={'prefix': prefix})
+        else:
+            response = client.get(f"/{bucket}")
         
         if response.status_code == 200:
             return {
@@ -137,14 +140,13 @@ class AwsClient:
         """
         client = self.get_client('ec2')
         
-        params = {
-            'Action': 'DescribeInstances',
-            'Version': '2016-11-15'
-        }
+        params = [
+            ('Action', 'DescribeInstances'),
+            ('Version', '2016-11-15')
+        ]
         
         if instance_ids:
-            for i, instance_id in enumerate(instance_ids):
-                params[f'InstanceId.{i+1}'] = instance_id
+            params.extend((f'InstanceId.{i+1}', instance_id) for i, instance_id in enumerate(instance_ids))
         
         response = client.get('/', params=params)
         
@@ -183,10 +185,34 @@ class AwsClient:
                 'response': response.text
             }
     
+    def list_all(self, max_workers: int = 8) -> Dict[str, Dict[str, Any]]:
+        """
+        List S3 buckets, EC2 instances and Lambda functions concurrently.
+        
+        The requests are network-bound and independent, so they run on a
+        thread pool and the total time is roughly that of the slowest call.
+        
+        Args:
+            max_workers: Maximum number of concurrent requests (default: 8)
+            
+        Returns:
+            Dict: Result of each list operation, keyed by resource type
+        """
+        # Create the API clients up front; client creation is not thread-safe
+        for service in ('s3', 'ec2', 'lambda'):
+            self.get_client(service)
+        
+        return run_concurrently({
+            'buckets': self.s3_list_buckets,
+            'instances': self.ec2_describe_instances,
+            'functions': self.lambda_list_functions
+        }, max_workers=max_workers)
+    
     def close(self):
         """Close all API clients."""
         for service, client in self.clients.items():
             client.close()
-            self.logger.info(f"Closed AWS client for {service}")
+            self.logger.info("Closed AWS client for %s", service)
         
         self.clients = {}
+        self._session.close()
@@ -4,8 +4,9 @@ Azure cloud service client for API testing.
 import logging
 from typing import Dict, Any, Optional, List, Union
 
-from cloud_api_testing.api.client import ApiClient
+from cloud_api_testing.api.client import ApiClient, create_session
 from cloud_api_testing.auth.azure import AzureAuth
+from cloud_api_testing.cloud.common import list_endpoint, run_concurrently
 
 class AzureClient:
     """Client for testing Azure cloud services."""
@@ -32,6 +33,9 @@ class AzureClient:
         self.subscription_id = subscription_id
         self.logger = logging.getLogger(__name__)
         self.clients = {}
+        
+        # One connection pool shared by every per-service API client
+        self._session = create_session(pool_maxsize=20)
     
     def get_management_client(self) -> ApiClient:
         """
@@ -53,7 +57,7 @@ class AzureClient:
         )
         
         # Create API client
-        client = ApiClient(base_url='https://management.azure.com', auth=auth)
+        client = ApiClient(base_url='https://management.azure.com', auth=auth, session=self._session)
         
         # Cache client
         self.clients['management'] = client
@@ -81,7 +85,7 @@ class AzureClient:
         )
         
         # Create API client
-        client = ApiClient(base_url='https://graph.microsoft.com/v1.0', auth=auth)
+        client = ApiClient(base_url='https://graph.microsoft.com/v1.0', auth=auth, session=self._session)
         
         # Cache client
         self.clients['graph'] = client
@@ -103,19 +107,8 @@ class AzureClient:
             }
         
         client = self.get_management_client()
-        response = client.get(f"/subscriptions/{self.subscription_id}/resourcegroups?api-version=2021-04-01")
-        
-        if response.status_code == 200:
-            return {
-                'success': True,
-                'resource_groups': response.json.get('value', [])
-            }
-        else:
-            return {
-                'success': False,
-                'error': f"Failed to list resource groups: {response.status_code}",
-                'response': response.text
-            }
+        endpoint = f"/subscriptions/{self.subscription_id}/resourcegroups?api-version=2021-04-01"
+        return list_endpoint(client, endpoint, 'resource_groups', 'value')
     
     def list_virtual_machines(self, resource_group: str = None) -> Dict[str, Any]:
         """
@@ -142,19 +135,7 @@ class AzureClient:
             # List VMs in subscription
             endpoint = f"/subscriptions/{self.subscription_id}/providers/Microsoft.Compute/virtualMachines?api-version=2022-03-01"
         
-        response = client.get(endpoint)
-        
-        if response.status_code == 200:
-            return {
-                'success': True,
-                'virtual_machines': response.json.get('value', [])
-            }
-        else:
-            return {
-                'success': False,
-                'error': f"Failed to list virtual machines: {response.status_code}",
-                'response': response.text
-            }
+        return list_endpoint(client, endpoint, 'virtual_machines', 'value')
     
     def list_storage_accounts(self, resource_group: str = None) -> Dict[str, Any]:
         """
@@ -181,19 +162,7 @@ class AzureClient:
             # List storage accounts in subscription
             endpoint = f"/subscriptions/{self.subscription_id}/providers/Microsoft.Storage/storageAccounts?api-version=2021-09-01"
         
-        response = client.get(endpoint)
-        
-        if response.status_code == 200:
-            return {
-                'success': True,
-                'storage_accounts': response.json.get('value', [])
-            }
-        else:
-            return {
-                'success': False,
-                'error': f"Failed to list storage accounts: {response.status_code}",
-                'response': response.text
-            }
+        return list_endpoint(client, endpoint, 'storage_accounts', 'value')
     
     def list_users(self) -> Dict[str, Any]:
         """
@@ -203,24 +172,38 @@ class AzureClient:
             Dict: Response data
         """
         client = self.get_graph_client()
-        response = client.get("/users")
+        return list_endpoint(client, "/users", 'users', 'value')
+    
+    def list_all(self, max_workers: int = 8) -> Dict[str, Dict[str, Any]]:
+        """
+        List resource groups, VMs, storage accounts and users concurrently.
         
-        if response.status_code == 200:
-            return {
-                'success': True,
-                'users': response.json.get('value', [])
-            }
-        else:
-            return {
-                'success': False,
-                'error': f"Failed to list users: {response.status_code}",
-                'response': response.text
-            }
+        Each call runs on a thread pool; the ARM and Graph requests share
+        the client's connection pool and cached tokens.
+        
+        Args:
+            max_workers: Maximum number of concurrent requests (default: 8)
+            
+        Returns:
+            Dict: Result of each list operation, keyed by resource type
+        """
+        # Create the API clients up front; client creation is not thread-safe
+        self.get_management_client()
+        self.get_graph_client()
+        
+        return run_concurrently({
+            'resource_groups': self.list_resource_groups,
+            'virtual_machines': self.list_virtual_machines,
+            'storage_accounts': self.list_storage_accounts,
+            'users': self.list_users
+        }, max_workers=max_workers)
     
     def close(self):
         """Close all API clients."""
         for service, client in self.clients.items():
             client.close()
-            self.logger.info(f"Closed Azure client for {service}")
+            client.auth.close()
+            self.logger.info("Closed Azure client for %s", service)
         
         self.clients = {}
+        self._session.close()
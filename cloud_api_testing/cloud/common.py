@@ -0,0 +1,59 @@
+"""
+Helpers shared by the cloud service clients.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable
+
+from cloud_api_testing.api.client import ApiClient
+
+def list_endpoint(
+    client: ApiClient,
+    endpoint: str,
+    result_key: str,
+    field: str,
+    **kwargs
+) -> Dict[str, Any]:
+    """
+    List resources from a collection endpoint.
+    
+    Args:
+        client: API client to send the request with
+        endpoint: API endpoint
+        result_key: Key for the resource list in the result
+        field: Response field holding the resource list
+        **kwargs: Additional arguments for the GET request
+        
+    Returns:
+        Dict: Response data
+    """
+    response = client.get(endpoint, **kwargs)
+    
+    if response.status_code == 200:
+        return {
+            'success': True,
+            result_key: response.json.get(field, [])
+        }
+    else:
+        return {
+            'success': False,
+            'error': f"Failed to list {result_key.replace('_', ' ')}: {response.status_code}",
+            'response': response.text
+        }
+
+def run_concurrently(
+    calls: Dict[str, Callable[[], Dict[str, Any]]],
+    max_workers: int = 8
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run independent list operations on a thread pool.
+    
+    Args:
+        calls: List operations to run, keyed by resource type
+        max_workers: Maximum number of concurrent requests (default: 8)
+        
+    Returns:
+        Dict: Result of each list operation, keyed by resource type
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {key: executor.submit(call) for key, call in calls.items()}
+        return {key: future.result() for key, future in futures.items()}
@@ -4,8 +4,9 @@ GCP cloud service client for API testing.
 import logging
 from typing import Dict, Any, Optional, List, Union
 
-from cloud_api_testing.api.client import ApiClient
+from cloud_api_testing.api.client import ApiClient, create_session
 from cloud_api_testing.auth.gcp import GcpAuth
+from cloud_api_testing.cloud.common import list_endpoint, run_concurrently
 
 class GcpClient:
     """Client for testing Google Cloud Platform services."""
@@ -37,6 +38,15 @@ class GcpClient:
             
         self.logger = logging.getLogger(__name__)
         self.clients = {}
+        
+        # One authentication handler (and cached token) for all GCP services
+        self._auth = GcpAuth(
+            service_account_key=service_account_key,
+            service_account_file=service_account_file
+        )
+        
+        # One connection pool shared by every per-service API client
+        self._session = create_session(pool_maxsize=20)
     
     def get_client(self, service: str, version: str = 'v1') -> ApiClient:
         """
@@ -54,22 +64,16 @@ class GcpClient:
         if client_key in self.clients:
             return self.clients[client_key]
         
-        # Create authentication handler
-        auth = GcpAuth(
-            service_account_key=self.service_account_key,
-            service_account_file=self.service_account_file
-        )
-        
         # Create base URL for service
         base_url = f"https://{service}.googleapis.com/{version}"
         
         # Create API client
-        client = ApiClient(base_url=base_url, auth=auth)
+        client = ApiClient(base_url=base_url, auth=self._auth, session=self._session)
         
         # Cache client
         self.clients[client_key] = client
         
-        self.logger.info(f"Created GCP client for {service} {version}")
+        self.logger.info("Created GCP client for %s %s", service, version)
         return client
     
     def list_compute_instances(self, zone: str = None) -> Dict[str, Any]:
@@ -97,19 +101,7 @@ class GcpClient:
             # List instances in all zones (aggregated)
             endpoint = f"/projects/{self.project_id}/aggregated/instances"
         
-        response = client.get(endpoint)
-        
-        if response.status_code == 200:
-            return {
-                'success': True,
-                'instances': response.json.get('items', [])
-            }
-        else:
-            return {
-                'success': False,
-                'error': f"Failed to list instances: {response.status_code}",
-                'response': response.text
-            }
+        return list_endpoint(client, endpoint, 'instances', 'items')
     
     def list_storage_buckets(self) -> Dict[str, Any]:
         """
@@ -125,19 +117,7 @@ class GcpClient:
             }
         
         client = self.get_client('storage')
-        response = client.get(f"/b?project={self.project_id}")
-        
-        if response.status_code == 200:
-            return {
-                'success': True,
-                'buckets': response.json.get('items', [])
-            }
-        else:
-            return {
-                'success': False,
-                'error': f"Failed to list buckets: {response.status_code}",
-                'response': response.text
-            }
+        return list_endpoint(client, f"/b?project={self.project_id}", 'buckets', 'items')
     
     def list_storage_objects(self, bucket: str, prefix: str = None) -> Dict[str, Any]:
         """
@@ -152,23 +132,9 @@ class GcpClient:
         """
         client = self.get_client('storage')
         
-        params = {}
         if prefix:
-            params['prefix'] = prefix
-        
-        response = client.get(f"/b/{bucket}/o", params=params)
-        
-        if response.status_code == 200:
-            return {
-                'success': True,
-                'objects': response.json.get('items', [])
-            }
-        else:
-            return {
-                'success': False,
-                'error': f"Failed to list objects: {response.status_code}",
-                'response': response.text
-            }
+            return list_endpoint(client, f"/b/{bucket}/o", 'objects', 'items', params={'prefix': prefix})
+        return list_endpoint(client, f"/b/{bucket}/o", 'objects', 'items')
     
     def list_cloud_functions(self, region: str = None) -> Dict[str, Any]:
         """
@@ -195,24 +161,36 @@ class GcpClient:
             # List functions in all regions
             endpoint = f"/projects/{self.project_id}/locations/-/functions"
         
-        response = client.get(endpoint)
+        return list_endpoint(client, endpoint, 'functions', 'functions')
+    
+    def list_all(self, max_workers: int = 8) -> Dict[str, Dict[str, Any]]:
+        """
+        List Compute instances, Storage buckets and Cloud Functions concurrently.
         
-        if response.status_code == 200:
-            return {
-                'success': True,
-                'functions': response.json.get('functions', [])
-            }
-        else:
-            return {
-                'success': False,
-                'error': f"Failed to list functions: {response.status_code}",
-                'response': response.text
-            }
+        Each call runs on a thread pool; all of them share one GcpAuth,
+        so at most one thread refreshes the access token.
+        
+        Args:
+            max_workers: Maximum number of concurrent requests (default: 8)
+            
+        Returns:
+            Dict: Result of each list operation, keyed by resource type
+        """
+        # Create the API clients up front; client creation is not thread-safe
+        for service in ('compute', 'storage', 'cloudfunctions'):
+            self.get_client(service)
+        
+        return run_concurrently({
+            'instances': self.list_compute_instances,
+            'buckets': self.list_storage_buckets,
+            'functions': self.list_cloud_functions
+        }, max_workers=max_workers)
     
     def close(self):
         """Close all API clients."""
         for service, client in self.clients.items():
             client.close()
-            self.logger.info(f"Closed GCP client for {service}")
+            self.logger.info("Closed GCP client for %s", service)
         
         self.clients = {}
+        self._session.close()
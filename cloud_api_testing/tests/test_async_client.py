@@ -0,0 +1,169 @@
+"""
+Tests for the async API client transport.
+"""
+import asyncio
+import threading
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from cloud_api_testing.api.async_client import AsyncApiClient, gather_with_concurrency
+
+async def _echo(request: web.Request) -> web.Response:
+    """Echo the request back as JSON."""
+    return web.json_response({
+        'method': request.method,
+        'query': dict(request.query),
+        'authorization': request.headers.get('Authorization'),
+        'body': await request.text()
+    }, headers={'X-Echo': 'yes'})
+
+async def _slow(request: web.Request) -> web.Response:
+    """Respond after the delay given in the query string."""
+    await asyncio.sleep(float(request.query['delay']))
+    return web.Response(text='done')
+
+class _ThreadRecordingAuth:
+    """Auth handler that records the thread it is called on."""
+    
+    def __init__(self):
+        self.threads = []
+    
+    def get_auth_headers(self, method, url, headers=None, params=None, data=None, json_data=None):
+        self.threads.append(threading.get_ident())
+        return {'Authorization': f"Test {method}"}
+
+class AsyncApiClientTest(unittest.IsolatedAsyncioTestCase):
+    """AsyncApiClient against a local aiohttp server."""
+    
+    async def asyncSetUp(self):
+        app = web.Application()
+        app.router.add_route('*', '/echo', _echo)
+        app.router.add_get('/slow', _slow)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.base_url = str(self.server.make_url(''))
+    
+    async def asyncTearDown(self):
+        await self.server.close()
+    
+    async def test_send_request(self):
+        auth = _ThreadRecordingAuth()
+        client = AsyncApiClient(self.base_url, auth=auth)
+        try:
+            response = await client.post('/echo', params={'a': '1'}, json_data={'b': 2})
+        finally:
+            await client.close()
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_header('x-echo'), 'yes')
+        self.assertEqual(response.json, {
+            'method': 'POST',
+            'query': {'a': '1'},
+            'authorization': 'Test POST',
+            'body': '{"b": 2}'
+        })
+        self.assertEqual(response.request_info['method'], 'POST')
+    
+    async def test_auth_runs_off_the_event_loop(self):
+        auth = _ThreadRecordingAuth()
+        client = AsyncApiClient(self.base_url, auth=auth)
+        try:
+            await client.get('/echo')
+        finally:
+            await client.close()
+        
+        self.assertEqual(len(auth.threads), 1)
+        self.assertNotEqual(auth.threads[0], threading.get_ident())
+    
+    async def test_default_timeout(self):
+        client = AsyncApiClient(self.base_url, timeout=0.2)
+        try:
+            with self.assertRaises(asyncio.TimeoutError):
+                await client.get('/slow', params={'delay': '2'})
+        finally:
+            await client.close()
+    
+    async def test_per_request_timeout_overrides_default(self):
+        client = AsyncApiClient(self.base_url, timeout=0.2)
+        try:
+            response = await client.get('/slow', params={'delay': '0.4'}, timeout=5)
+            self.assertEqual(response.text, 'done')
+        finally:
+            await client.close()
+        
+        client = AsyncApiClient(self.base_url, timeout=5)
+        try:
+            with self.assertRaises(asyncio.TimeoutError):
+                await client.get('/slow', params={'delay': '2'}, timeout=0.2)
+        finally:
+            await client.close()
+
+class ConnectionLimitTest(unittest.IsolatedAsyncioTestCase):
+    """Concurrent requests share the pool without exceeding limit_per_host."""
+    
+    LIMIT = 4
+    REQUESTS = 50
+    
+    async def asyncSetUp(self):
+        self.in_flight = 0
+        self.peak = 0
+        
+        async def tracked(request: web.Request) -> web.Response:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            try:
+                await asyncio.sleep(0.01)
+            finally:
+                self.in_flight -= 1
+            return web.Response(text=request.query['i'])
+        
+        app = web.Application()
+        app.router.add_get('/tracked', tracked)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.base_url = str(self.server.make_url(''))
+    
+    async def asyncTearDown(self):
+        await self.server.close()
+    
+    async def test_limit_per_host(self):
+        client = AsyncApiClient(self.base_url, limit_per_host=self.LIMIT)
+        try:
+            responses = await asyncio.gather(*(
+                client.get('/tracked', params={'i': str(i)}) for i in range(self.REQUESTS)
+            ))
+        finally:
+            await client.close()
+        
+        self.assertEqual([response.status_code for response in responses], [200] * self.REQUESTS)
+        self.assertEqual([response.text for response in responses], [str(i) for i in range(self.REQUESTS)])
+        self.assertLessEqual(self.peak, self.LIMIT)
+        # Requests did overlap, so the limit was what held them back
+        self.assertGreater(self.peak, 1)
+
+class GatherWithConcurrencyTest(unittest.IsolatedAsyncioTestCase):
+    """gather_with_concurrency keeps order and its in-flight limit."""
+    
+    async def test_order_and_limit(self):
+        in_flight = 0
+        peak = 0
+        
+        async def job(value: int, delay: float) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(delay)
+            in_flight -= 1
+            return value
+        
+        results = await gather_with_concurrency(
+            3, *(job(i, 0.01 * (10 - i)) for i in range(10))
+        )
+        
+        self.assertEqual(results, list(range(10)))
+        self.assertEqual(peak, 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,217 @@
+"""
+Regression tests for AWS Signature Version 4 signing.
+"""
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+
+from cloud_api_testing.auth import aws
+from cloud_api_testing.auth.aws import AwsAuth
+
+# Credentials and host of the AWS SigV4 test suite
+ACCESS_KEY = 'AKIDEXAMPLE'
+SECRET_KEY = 'wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY'
+HOST = 'example.amazonaws.com'
+URL = f'https://{HOST}/'
+
+def _frozen_datetime(moment: datetime) -> type:
+    """
+    Get a datetime class whose now() always returns moment.
+    
+    Args:
+        moment: Timestamp to return (UTC)
+        
+    Returns:
+        type: datetime subclass to patch into the aws module
+    """
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return moment
+    
+    return FrozenDatetime
+
+def _sign(auth: AwsAuth, moment: datetime, method: str, url: str = URL, **kwargs) -> dict:
+    """
+    Sign a request at a fixed time.
+    
+    Args:
+        auth: AWS authentication handler
+        moment: Signing time (UTC)
+        method: HTTP method
+        url: Request URL
+        **kwargs: Additional arguments for get_auth_headers
+        
+    Returns:
+        dict: Signed request headers
+    """
+    with mock.patch.object(aws, 'datetime', _frozen_datetime(moment)):
+        return auth.get_auth_headers(method, url, **kwargs)
+
+def _signature(headers: dict) -> str:
+    """Get the signature from signed request headers."""
+    return headers['Authorization'].rsplit('Signature=', 1)[1]
+
+# 2015-08-30T12:36:00Z, the timestamp used throughout the AWS SigV4 test suite
+SUITE_TIME = datetime(2015, 8, 30, 12, 36, 0, tzinfo=timezone.utc)
+NEXT_DAY = datetime(2015, 8, 31, 0, 0, 1, tzinfo=timezone.utc)
+
+class AwsSigV4SuiteTest(unittest.TestCase):
+    """Vectors from the AWS SigV4 test suite."""
+    
+    def setUp(self):
+        self.auth = AwsAuth(ACCESS_KEY, SECRET_KEY, region='us-east-1', service='service')
+    
+    def test_get_vanilla(self):
+        headers = _sign(self.auth, SUITE_TIME, 'GET', headers={'Host': HOST})
+        self.assertEqual(headers['X-Amz-Date'], '20150830T123600Z')
+        self.assertEqual(
+            headers['Authorization'],
+            'AWS4-HMAC-SHA256 Credential=AKIDEXAMPLE/20150830/us-east-1/service/aws4_request, '
+            'SignedHeaders=host;x-amz-date, '
+            'Signature=5fa00fa31553b73ebf1942676e86291e8372ff2a2260956d9b8aae1d763fbf31'
+        )
+    
+    def test_get_vanilla_query_order_key_case(self):
+        headers = _sign(
+            self.auth, SUITE_TIME, 'GET',
+            headers={'Host': HOST},
+            params={'Param2': 'value2', 'Param1': 'value1'}
+        )
+        self.assertEqual(
+            _signature(headers),
+            'b97d918cfa904a5beff61c982a1b6f458b799221646efd99d3219ec94cdf2500'
+        )
+    
+    def test_post_vanilla(self):
+        headers = _sign(self.auth, SUITE_TIME, 'POST', headers={'Host': HOST})
+        self.assertEqual(
+            _signature(headers),
+            '5da7c1a2acd57cee7505fc6676e4e544621c30862966e37dddb68e92efbe5d6b'
+        )
+
+class AwsSigningRegressionTest(unittest.TestCase):
+    """Signatures produced by the original, uncached signing code."""
+    
+    def setUp(self):
+        self.auth = AwsAuth(ACCESS_KEY, SECRET_KEY, region='us-east-1', service='service')
+    
+    def assertSignature(self, expected: str, method: str, url: str = URL, **kwargs):
+        self.assertEqual(_signature(_sign(self.auth, SUITE_TIME, method, url, **kwargs)), expected)
+    
+    def test_canonical_uri(self):
+        self.assertSignature(
+            '113e9375c7ca808d508f0200912af065e705a6e598cb73b1ac3fab5ba8db0220',
+            'GET', f'https://{HOST}/bucket/key.txt'
+        )
+        self.assertSignature(
+            'cf22de7d727edb2c716390ee04d3182ac3715395d779026dd667b3876e6e71fe',
+            'GET', f'https://{HOST}'
+        )
+    
+    def test_canonical_querystring_encoding(self):
+        self.assertSignature(
+            '5736c439cf9bda44847130e9c2191da6a91fcdd9486b01e9a75adf4c7b09e6a2',
+            'GET', params={'b': 'a b/c', 'a': 'x~y_z.-', 'c': 'é=&', 'n': 5}
+        )
+    
+    def test_canonical_querystring_from_pairs(self):
+        self.assertSignature(
+            '5736c439cf9bda44847130e9c2191da6a91fcdd9486b01e9a75adf4c7b09e6a2',
+            'GET', params=[('n', 5), ('c', 'é=&'), ('b', 'a b/c'), ('a', 'x~y_z.-')]
+        )
+    
+    def test_canonical_headers(self):
+        self.assertSignature(
+            '7926da608c87a04be695f529ffc45c987d4a2f802491442e13b3aeaa4529ebf3',
+            'GET',
+            headers={
+                'Host': HOST,
+                'Content-Type': ' application/json ',
+                'X-Amz-Security-Token': 'token',
+                'Accept': '*/*'
+            }
+        )
+    
+    def test_payload_hash(self):
+        self.assertSignature(
+            '286a8af17ec9f7a1df6cd3bce092cfa38a711e7b2571f590767f164f524b5a86',
+            'PUT', f'https://{HOST}/k', data='hello'
+        )
+        # Bytes are hashed as sent, so they sign the same as the equivalent text
+        self.assertSignature(
+            '286a8af17ec9f7a1df6cd3bce092cfa38a711e7b2571f590767f164f524b5a86',
+            'PUT', f'https://{HOST}/k', data=b'hello'
+        )
+        self.assertSignature(
+            '2b76ad3ca2e6b82eba81e77a8257ec05d13995056ba9cffc0119ab55759e7d01',
+            'POST', json_data={'b': 1, 'a': [1, 'x']}
+        )
+    
+    def test_signing_key_follows_the_date(self):
+        _sign(self.auth, SUITE_TIME, 'GET', headers={'Host': HOST})
+        headers = _sign(self.auth, NEXT_DAY, 'GET', headers={'Host': HOST})
+        self.assertEqual(
+            headers['Authorization'],
+            'AWS4-HMAC-SHA256 Credential=AKIDEXAMPLE/20150831/us-east-1/service/aws4_request, '
+            'SignedHeaders=host;x-amz-date, '
+            'Signature=7b62a1e066715148eedb81d38758cca8cef7be3fea03eb1c11d458649e25ea98'
+        )
+        headers = _sign(self.auth, SUITE_TIME, 'GET', headers={'Host': HOST})
+        self.assertEqual(
+            _signature(headers),
+            '5fa00fa31553b73ebf1942676e86291e8372ff2a2260956d9b8aae1d763fbf31'
+        )
+    
+    def test_signing_caches_keep_only_the_current_date(self):
+        for moment in (SUITE_TIME, NEXT_DAY, SUITE_TIME, NEXT_DAY):
+            _sign(self.auth, moment, 'GET', headers={'Host': HOST})
+        self.auth.region = 'eu-west-1'
+        _sign(self.auth, NEXT_DAY, 'GET', headers={'Host': HOST})
+        
+        scope_keys = [('20150831', 'us-east-1', 'service'), ('20150831', 'eu-west-1', 'service')]
+        self.assertEqual(list(self.auth._signing_key_cache), scope_keys)
+        self.assertEqual(list(self.auth._credential_scope_cache), scope_keys)
+    
+    def test_repeated_header_set(self):
+        request_headers = {'Host': HOST}
+        self.assertSignature(
+            '5fa00fa31553b73ebf1942676e86291e8372ff2a2260956d9b8aae1d763fbf31',
+            'GET', headers=request_headers
+        )
+        # Same cached header layout, re-signed with another method and then another date
+        self.assertSignature(
+            '5da7c1a2acd57cee7505fc6676e4e544621c30862966e37dddb68e92efbe5d6b',
+            'POST', headers=request_headers
+        )
+        headers = _sign(self.auth, NEXT_DAY, 'GET', headers=request_headers)
+        self.assertEqual(
+            _signature(headers),
+            '7b62a1e066715148eedb81d38758cca8cef7be3fea03eb1c11d458649e25ea98'
+        )
+        self.assertEqual(request_headers, {'Host': HOST})
+    
+    def test_header_layout_keeps_no_values(self):
+        headers = {'Host': HOST, 'X-Amz-Security-Token': 'first-token'}
+        first = _signature(_sign(self.auth, SUITE_TIME, 'GET', headers=headers))
+        headers['X-Amz-Security-Token'] = 'second-token'
+        second = _signature(_sign(self.auth, SUITE_TIME, 'GET', headers=headers))
+        
+        # Same names, so one layout, but the signature follows the current value
+        self.assertNotEqual(first, second)
+        self.assertEqual(list(self.auth._header_layout_cache), [('Host', 'X-Amz-Security-Token')])
+        self.assertNotIn('first-token', repr(self.auth._header_layout_cache))
+        self.assertNotIn('second-token', repr(self.auth._header_layout_cache))
+        
+        # Layouts belong to the instance that signed
+        self.assertEqual(AwsAuth(ACCESS_KEY, SECRET_KEY)._header_layout_cache, {})
+    
+    def test_header_names_differing_in_case(self):
+        # Canonical lines for names equal after lowercasing are ordered by value
+        self.assertSignature(
+            '32502febe40d144301781c9156036d6fd358caa8dcc6e6a07d361ac7b025f4de',
+            'GET', headers={'Host': HOST, 'x-test': 'b', 'X-Test': 'a'}
+        )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,206 @@
+"""
+Tests for JSON schema validation.
+"""
+import copy
+import unittest
+from unittest import mock
+
+import jsonschema
+
+from cloud_api_testing.validation import json_schema
+from cloud_api_testing.validation.json_schema import JsonSchemaValidator
+
+def _reference_result(data, schema) -> dict:
+    """
+    Validate with jsonschema.validate and shape the outcome like JsonSchemaValidator.validate.
+    
+    Args:
+        data: Data to validate
+        schema: JSON schema
+        
+    Returns:
+        dict: Validation result with 'valid' and 'errors' keys
+    """
+    try:
+        jsonschema.validate(data, schema)
+    except jsonschema.exceptions.ValidationError as e:
+        return {
+            'valid': False,
+            'errors': [{
+                'message': str(e),
+                'path': '.'.join(str(p) for p in e.path) if e.path else '',
+                'schema_path': '.'.join(str(p) for p in e.schema_path) if e.schema_path else ''
+            }]
+        }
+    return {'valid': True, 'errors': []}
+
+# Instances of every JSON type, plus the int/float/bool edge cases of the type checks
+INSTANCES = [
+    {}, {'id': 1}, {'id': 1, 'name': 'a'}, {'name': None},
+    [], [{'id': 1}], 'text', '', 0, 1, -3, 1.0, 2.5, True, False, None
+]
+
+class TrivialSchemaValidatorTest(unittest.TestCase):
+    """The type/required fast path matches jsonschema.validate exactly."""
+    
+    SCHEMAS = [
+        {'type': schema_type}
+        for schema_type in ('object', 'array', 'string', 'number', 'integer', 'boolean', 'null')
+    ] + [
+        {'type': 'object', 'required': ['id']},
+        {'type': 'object', 'required': ['id', 'name']},
+        {'type': 'object', 'required': []},
+        {'type': 'object', 'title': 'Item', 'description': 'An item', 'required': ['name', 'id']},
+        {'type': 'array', 'required': ['id']},
+        {'type': 'integer', 'title': 'Count'}
+    ]
+    
+    def test_schemas_use_the_fast_path(self):
+        validator = JsonSchemaValidator()
+        for schema in self.SCHEMAS:
+            with self.subTest(schema=schema):
+                _, compiled = validator._get_inline_validator(schema)
+                self.assertIsInstance(compiled, json_schema._TrivialSchemaValidator)
+    
+    def test_results_match_jsonschema(self):
+        validator = JsonSchemaValidator()
+        for schema in self.SCHEMAS:
+            for data in INSTANCES:
+                with self.subTest(schema=schema, data=data):
+                    self.assertEqual(validator.validate(data, schema), _reference_result(data, schema))
+    
+    def test_error_messages(self):
+        validator = JsonSchemaValidator()
+        
+        result = validator.validate({'id': 1}, {'type': 'object', 'required': ['id', 'name']})
+        self.assertEqual(result, _reference_result({'id': 1}, {'type': 'object', 'required': ['id', 'name']}))
+        self.assertTrue(result['errors'][0]['message'].startswith("'name' is a required property"))
+        self.assertEqual(result['errors'][0]['schema_path'], 'required')
+        
+        result = validator.validate([1], {'type': 'object', 'title': 'Item'})
+        self.assertTrue(result['errors'][0]['message'].startswith("[1] is not of type 'object'"))
+        self.assertEqual(result['errors'][0]['schema_path'], 'type')
+    
+    def test_non_dict_instances(self):
+        validator = JsonSchemaValidator()
+        # required only applies to objects, so other instances of a matching type pass
+        for data, schema_type in (([], 'array'), ('id', 'string'), (5, 'integer'), (None, 'null')):
+            schema = {'type': schema_type, 'required': ['id']}
+            with self.subTest(data=data):
+                self.assertEqual(validator.validate(data, schema), {'valid': True, 'errors': []})
+                self.assertEqual(validator.validate(data, schema), _reference_result(data, schema))
+        
+        # Tuples are not JSON arrays for jsonschema's type checker
+        for schema in ({'type': 'array'}, {'type': 'object', 'required': ['id']}):
+            with self.subTest(schema=schema):
+                self.assertEqual(validator.validate((1, 2), schema), _reference_result((1, 2), schema))
+
+class InlineSchemaTest(unittest.TestCase):
+    """Compiled inline schemas follow edits made to the schema dict."""
+    
+    def test_mutated_schema_applies(self):
+        validator = JsonSchemaValidator()
+        schema = {'type': 'object', 'properties': {'id': {'type': 'integer'}}}
+        original = copy.deepcopy(schema)
+        data = {'id': 1, 'name': 'a'}
+        self.assertTrue(validator.validate(data, schema)['valid'])
+        
+        schema['required'] = ['id', 'status']
+        result = validator.validate(data, schema)
+        self.assertFalse(result['valid'])
+        self.assertTrue(result['errors'][0]['message'].startswith("'status' is a required property"))
+        
+        schema['properties']['id']['type'] = 'string'
+        del schema['required']
+        result = validator.validate(data, schema)
+        self.assertFalse(result['valid'])
+        self.assertEqual(result['errors'][0]['path'], 'id')
+        
+        # An equal copy of the original schema is not affected by the edits
+        self.assertTrue(validator.validate(data, original)['valid'])
+        
+        # Back to the original content, which validates as before
+        schema['properties']['id']['type'] = 'integer'
+        self.assertTrue(validator.validate(data, schema)['valid'])
+    
+    def test_mutated_trivial_schema_applies(self):
+        validator = JsonSchemaValidator()
+        schema = {'type': 'object', 'required': ['id']}
+        self.assertTrue(validator.validate({'id': 1}, schema)['valid'])
+        
+        schema['required'].append('name')
+        self.assertFalse(validator.validate({'id': 1}, schema)['valid'])
+        
+        schema['type'] = 'array'
+        schema['required'].clear()
+        self.assertTrue(validator.validate([], schema)['valid'])
+        self.assertFalse(validator.validate({'id': 1}, schema)['valid'])
+
+class ResultCacheTest(unittest.TestCase):
+    """Successful validations are remembered only within the configured bound."""
+    
+    SCHEMA = {'type': 'object', 'properties': {'id': {'type': 'integer'}}, 'required': ['id']}
+    
+    def assertCacheHit(self, validator: JsonSchemaValidator, data, hit: bool):
+        with mock.patch.object(
+            jsonschema.exceptions, 'best_match', wraps=jsonschema.exceptions.best_match
+        ) as best_match:
+            self.assertTrue(validator.validate(data, self.SCHEMA)['valid'])
+        self.assertEqual(best_match.called, not hit)
+    
+    def test_size_bound(self):
+        validator = JsonSchemaValidator(result_cache_size=2)
+        for i in range(3):
+            validator.validate({'id': i}, self.SCHEMA)
+        self.assertEqual(len(validator._result_cache), 2)
+        
+        # Least recently used entry goes first
+        self.assertCacheHit(validator, {'id': 1}, hit=True)
+        self.assertCacheHit(validator, {'id': 0}, hit=False)
+        self.assertCacheHit(validator, {'id': 1}, hit=True)
+        self.assertCacheHit(validator, {'id': 2}, hit=False)
+        self.assertEqual(len(validator._result_cache), 2)
+    
+    def test_failures_are_not_cached(self):
+        validator = JsonSchemaValidator(result_cache_size=8)
+        for _ in range(2):
+            self.assertFalse(validator.validate({'id': 'a'}, self.SCHEMA)['valid'])
+        self.assertEqual(len(validator._result_cache), 0)
+    
+    def test_disabled_with_zero_size(self):
+        validator = JsonSchemaValidator(result_cache_size=0)
+        for _ in range(2):
+            self.assertCacheHit(validator, {'id': 1}, hit=False)
+        self.assertEqual(len(validator._result_cache), 0)
+        
+        # Disabled by default
+        self.assertEqual(JsonSchemaValidator().result_cache_size, 0)
+    
+    def test_non_json_native_data_bypasses_cache(self):
+        validator = JsonSchemaValidator(result_cache_size=8)
+        non_native = (
+            {'id': 1, 'tags': ('a',)},
+            {'id': 1, 'score': float('nan')},
+            {'id': 1, 2: 'x'},
+            {'id': 1, 'obj': object()}
+        )
+        for data in non_native:
+            with self.subTest(data=data):
+                self.assertCacheHit(validator, data, hit=False)
+                self.assertCacheHit(validator, data, hit=False)
+        self.assertEqual(len(validator._result_cache), 0)
+    
+    def test_lookalike_data_is_validated(self):
+        # A tuple canonicalizes like the cached list but is not a JSON array
+        validator = JsonSchemaValidator(result_cache_size=8)
+        schema = {'type': 'object', 'properties': {'ids': {'type': 'array'}}}
+        self.assertTrue(validator.validate({'ids': [1, 2]}, schema)['valid'])
+        self.assertFalse(validator.validate({'ids': (1, 2)}, schema)['valid'])
+        
+        # True and 1 are different JSON values
+        schema = {'type': 'object', 'properties': {'id': {'type': 'integer'}}}
+        self.assertTrue(validator.validate({'id': 1}, schema)['valid'])
+        self.assertFalse(validator.validate({'id': True}, schema)['valid'])
+
+if __name__ == '__main__':
+    unittest.main()
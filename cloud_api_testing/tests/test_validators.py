@@ -0,0 +1,168 @@
+"""
+Tests for the response validators.
+"""
+import json
+import unittest
+
+from cloud_api_testing.api.response import Response
+from cloud_api_testing.validation import validators as validators_module
+from cloud_api_testing.validation.validators import HeaderPatternSet, Validators
+
+def _response(headers=None, content: bytes = b'{}') -> Response:
+    """
+    Build a response with the given headers and body.
+    
+    Args:
+        headers: Response headers
+        content: Response body
+        
+    Returns:
+        Response: Response model
+    """
+    return Response(status_code=200, headers=headers or {}, content=content, elapsed_time=0.1)
+
+class RegexEngineTest(unittest.TestCase):
+    """Header patterns use re unless re2 is requested."""
+    
+    def test_default_engine_matches_like_re(self):
+        validators = Validators()
+        self.assertEqual(validators.regex_engine, 're')
+        # Unicode digits and $ before a trailing newline both match under re
+        self.assertTrue(validators.validate_header(_response({'X-Id': '١٢٣'}), 'X-Id', pattern=r'\d+$')['valid'])
+        self.assertTrue(validators.validate_header(_response({'X-Id': 'a\n'}), 'X-Id', pattern=r'a$')['valid'])
+    
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            Validators(regex_engine='pcre')
+    
+    @unittest.skipIf(validators_module.re2 is not None, "google-re2 is installed")
+    def test_re2_engine_requires_re2(self):
+        with self.assertRaises(ImportError):
+            Validators(regex_engine='re2')
+    
+    @unittest.skipIf(validators_module.re2 is None, "google-re2 is not installed")
+    def test_re2_engine_semantics(self):
+        validators = Validators(regex_engine='re2')
+        # The documented differences from re
+        self.assertFalse(validators.validate_header(_response({'X-Id': '١٢٣'}), 'X-Id', pattern=r'\d+$')['valid'])
+        self.assertFalse(validators.validate_header(_response({'X-Id': 'a\n'}), 'X-Id', pattern=r'a$')['valid'])
+        self.assertTrue(validators.validate_header(_response({'X-Id': '123'}), 'X-Id', pattern=r'\d+$')['valid'])
+        # Backreferences are not supported by re2 and fall back to re
+        self.assertTrue(validators.validate_header(_response({'X-Id': 'abab'}), 'X-Id', pattern=r'(ab)\1')['valid'])
+
+class ValidationResultTest(unittest.TestCase):
+    """Validation results are plain dicts."""
+    
+    def setUp(self):
+        self.validators = Validators()
+    
+    def test_result_is_a_dict(self):
+        result = self.validators.validate_header(_response({'X-Id': 'abc'}), 'X-Id', expected_value='abc')
+        expected = {
+            'valid': True,
+            'message': "Header 'X-Id' value 'abc' matches expected 'abc'",
+            'actual': 'abc',
+            'expected': 'abc',
+            'header_name': 'X-Id'
+        }
+        
+        self.assertIsInstance(result, dict)
+        self.assertEqual(result, expected)
+        self.assertEqual(dict(result), expected)
+        self.assertEqual(result.get('pattern'), None)
+        self.assertEqual(result.get('json_path', 'missing'), 'missing')
+        self.assertEqual(json.loads(json.dumps(result)), expected)
+        
+        del result['actual']
+        self.assertNotIn('actual', result)
+        with self.assertRaises(KeyError):
+            del result['pattern']
+    
+    def test_message_is_fixed_at_construction(self):
+        expected_value = [1, 2]
+        response = _response(content=b'{"items": [1, 2]}')
+        result = self.validators.validate_json_path(response, '$.items', expected_value=expected_value)
+        message = "Value at '$.items' matches expected '[1, 2]'"
+        self.assertEqual(result['message'], message)
+        
+        expected_value.append(3)
+        result['actual'].append(3)
+        self.assertEqual(result['message'], message)
+
+class HeaderPatternSetTest(unittest.TestCase):
+    """HeaderPatternSet gives the same results as validate_header, rule by rule."""
+    
+    HEADERS = {'Content-Type': 'application/json; charset=utf-8', 'X-Request-Id': 'abc-123'}
+    
+    def assertMatchesValidateHeader(self, validators: Validators, rules, headers=None):
+        response = _response(self.HEADERS if headers is None else headers)
+        pattern_set = HeaderPatternSet(validators)
+        for header_name, pattern in rules:
+            pattern_set.add(header_name, pattern)
+        
+        results = pattern_set.validate_all(response)
+        
+        self.assertEqual(results, [
+            validators.validate_header(response, header_name, pattern=pattern)
+            for header_name, pattern in rules
+        ])
+        return results
+    
+    def check_engine(self, regex_engine: str):
+        validators = Validators(regex_engine=regex_engine)
+        
+        with self.subTest('all match'):
+            results = self.assertMatchesValidateHeader(validators, [
+                ('Content-Type', r'application/json'),
+                ('content-type', r'.*charset=utf-8$'),
+                ('X-Request-Id', r'[a-z]+-\d+')
+            ])
+            self.assertEqual([result['valid'] for result in results], [True, True, True])
+        
+        with self.subTest('partial match'):
+            results = self.assertMatchesValidateHeader(validators, [
+                ('Content-Type', r'application/json'),
+                ('Content-Type', r'text/html'),
+                ('X-Request-Id', r'\d+'),
+                ('X-Request-Id', r'abc')
+            ])
+            self.assertEqual([result['valid'] for result in results], [True, False, False, True])
+        
+        with self.subTest('missing header'):
+            results = self.assertMatchesValidateHeader(validators, [
+                ('X-Missing', r'.*'),
+                ('Content-Type', r'application/'),
+                ('x-missing', r'abc')
+            ])
+            self.assertEqual([result['valid'] for result in results], [False, True, False])
+            self.assertEqual(results[0]['message'], "Header 'X-Missing' not found in response")
+        
+        with self.subTest('no headers'):
+            self.assertMatchesValidateHeader(validators, [('Content-Type', r'.*')], headers={})
+    
+    def test_re_engine(self):
+        self.check_engine('re')
+    
+    @unittest.skipIf(validators_module.re2 is None, "google-re2 is not installed")
+    def test_re2_engine(self):
+        self.check_engine('re2')
+    
+    @unittest.skipIf(validators_module.re2 is None, "google-re2 is not installed")
+    def test_re2_set_fallback(self):
+        # Backreferences and lookarounds are rejected by re2.Set and matched with re
+        validators = Validators(regex_engine='re2')
+        rules = [
+            ('X-Request-Id', r'abc'),
+            ('X-Request-Id', r'(\w)\w\1'),
+            ('X-Request-Id', r'abc(?=-)'),
+            ('X-Request-Id', r'(?!abc)'),
+            ('X-Request-Id', r'([a-z])\1')
+        ]
+        results = self.assertMatchesValidateHeader(validators, rules)
+        self.assertEqual([result['valid'] for result in results], [True, False, True, False, False])
+        
+        results = self.assertMatchesValidateHeader(validators, rules, headers={'X-Request-Id': 'aba-1'})
+        self.assertEqual([result['valid'] for result in results], [False, True, False, True, False])
+
+if __name__ == '__main__':
+    unittest.main()
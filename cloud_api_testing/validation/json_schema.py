@@ -1,24 +1,180 @@
 """
 JSON schema validation for API responses.
 """
+import copy
+import inspect
 import json
+import math
+import hashlib
+import numbers
 import jsonschema
 import logging
-from typing import Dict, Any, Optional, Union
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Union, Tuple, Iterator
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _canonical_json(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+except ImportError:
+    _json_loads = json.loads
+    
+    def _canonical_json(data: Any) -> bytes:
+        return json.dumps(data, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+# Maximum number of compiled validators kept for inline (dict) schemas
+_MAX_INLINE_VALIDATORS = 128
+
+# Type checks matching jsonschema's default type checker
+_TYPE_CHECKS = {
+    'object': lambda value: isinstance(value, dict),
+    'array': lambda value: isinstance(value, list),
+    'string': lambda value: isinstance(value, str),
+    'number': lambda value: isinstance(value, numbers.Number) and not isinstance(value, bool),
+    'integer': lambda value: (
+        (isinstance(value, int) and not isinstance(value, bool))
+        or (isinstance(value, float) and value.is_integer())
+    ),
+    'boolean': lambda value: isinstance(value, bool),
+    'null': lambda value: value is None
+}
+
+# Exact types the result cache accepts; anything else (tuples, sets, custom
+# classes) could canonicalize the same as a JSON value jsonschema treats differently
+_JSON_SCALAR_TYPES = (str, int, bool, type(None))
+
+def _is_json_native(data: Any) -> bool:
+    """
+    Check that data only contains JSON-native values.
+    
+    Args:
+        data: Data to check
+        
+    Returns:
+        bool: True for dicts with str keys, lists, str, int, finite float, bool and None
+    """
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+        if value_type is dict:
+            for key, item in value.items():
+                if type(key) is not str:
+                    return False
+                stack.append(item)
+        elif value_type is list:
+            stack.extend(value)
+        elif value_type is float:
+            # NaN/Infinity have no JSON form and may serialize as null
+            if not math.isfinite(value):
+                return False
+        elif value_type not in _JSON_SCALAR_TYPES:
+            return False
+    return True
+
+# Newer jsonschema errors carry the draft's type checker, which best_match uses to rank them
+_ERROR_TAKES_TYPE_CHECKER = 'type_checker' in inspect.signature(
+    jsonschema.exceptions.ValidationError.__init__
+).parameters
+
+# Keywords a schema may use and still be checked by the fast path
+_TRIVIAL_KEYWORDS = {'type', 'required', 'title', 'description'}
+
+class _TrivialSchemaValidator:
+    """Fast path for schemas that only constrain the top-level type and required keys."""
+    
+    def __init__(self, schema: Dict[str, Any], type_checker: Any):
+        """
+        Initialize the trivial schema validator.
+        
+        Args:
+            schema: JSON schema using only _TRIVIAL_KEYWORDS
+            type_checker: Type checker of the schema's draft validator
+        """
+        self.schema = schema
+        self._type = schema['type']
+        self._type_check = _TYPE_CHECKS[self._type]
+        # Fields jsonschema fills in on its own errors, so str(error) matches
+        self._error_fields = {'schema': schema}
+        if _ERROR_TAKES_TYPE_CHECKER:
+            self._error_fields['type_checker'] = type_checker
+    
+    @staticmethod
+    def handles(schema: Dict[str, Any]) -> bool:
+        """
+        Check whether a schema is simple enough for the fast path.
+        
+        Args:
+            schema: JSON schema
+            
+        Returns:
+            bool: True if the schema only uses a single type and required keys
+        """
+        if not isinstance(schema, dict) or not schema.keys() <= _TRIVIAL_KEYWORDS:
+            return False
+        schema_type = schema.get('type')
+        if not isinstance(schema_type, str) or schema_type not in _TYPE_CHECKS:
+            return False
+        required = schema.get('required', [])
+        return isinstance(required, list) and all(isinstance(key, str) for key in required)
+    
+    def iter_errors(self, instance: Any) -> Iterator[jsonschema.exceptions.ValidationError]:
+        """
+        Lazily yield validation errors, mirroring jsonschema's messages.
+        
+        Args:
+            instance: Data to validate
+            
+        Returns:
+            Iterator: Validation errors
+        """
+        schema = self.schema
+        if not self._type_check(instance):
+            yield jsonschema.exceptions.ValidationError(
+                f"{instance!r} is not of type {self._type!r}",
+                validator='type',
+                validator_value=self._type,
+                instance=instance,
+                schema_path=('type',),
+                **self._error_fields
+            )
+            return
+        
+        required = schema.get('required')
+        if required and isinstance(instance, dict):
+            for key in required:
+                if key not in instance:
+                    yield jsonschema.exceptions.ValidationError(
+                        f"{key!r} is a required property",
+                        validator='required',
+                        validator_value=required,
+                        instance=instance,
+                        schema_path=('required',),
+                        **self._error_fields
+                    )
 
 class JsonSchemaValidator:
     """Validator for JSON responses using JSON Schema."""
     
-    def __init__(self, schema_dir: Optional[str] = None):
+    def __init__(self, schema_dir: Optional[str] = None, result_cache_size: int = 0):
         """
         Initialize the JSON schema validator.
         
         Args:
             schema_dir: Directory containing schema files (optional)
+            result_cache_size: Number of successful validations to remember, for
+                suites that validate the same payloads repeatedly (default: 0, disabled)
         """
         self.schema_dir = schema_dir
         self.logger = logging.getLogger(__name__)
         self.schema_cache = {}
+        self.result_cache_size = result_cache_size
+        # (schema key, data digest) for data that passed validation
+        self._result_cache = OrderedDict()
+        # Schema content digest -> validator for schemas passed inline as dicts
+        self._inline_validators = OrderedDict()
     
     def validate(self, data: Dict[str, Any], schema: Union[Dict[str, Any], str]) -> Dict[str, Any]:
         """
@@ -35,9 +191,22 @@ class JsonSchemaValidator:
             FileNotFoundError: If schema file is not found
             jsonschema.exceptions.SchemaError: If schema is invalid
         """
-        # Load schema if it's a string (file path)
+        # Load schema if it's a string (file path), reusing its compiled validator
         if isinstance(schema, str):
-            schema = self._load_schema(schema)
+            schema_key = schema
+            schema, validator = self._load_schema(schema)
+        else:
+            schema_key, validator = self._get_inline_validator(schema)
+        
+        # Identical data already validated against the same schema
+        cache_key = self._result_cache_key(schema_key, data)
+        if cache_key is not None and cache_key in self._result_cache:
+            self._result_cache.move_to_end(cache_key)
+            self.logger.info("JSON validation successful")
+            return {
+                'valid': True,
+                'errors': []
+            }
         
         result = {
             'valid': True,
@@ -45,8 +214,16 @@ class JsonSchemaValidator:
         }
         
         try:
-            jsonschema.validate(instance=data, schema=schema)
+            # Same error selection as jsonschema.validate, minus re-checking the schema
+            error = jsonschema.exceptions.best_match(validator.iter_errors(data))
+            if error is not None:
+                raise error
             self.logger.info("JSON validation successful")
+            
+            if cache_key is not None:
+                self._result_cache[cache_key] = True
+                if len(self._result_cache) > self.result_cache_size:
+                    self._result_cache.popitem(last=False)
         except jsonschema.exceptions.ValidationError as e:
             result['valid'] = False
             result['errors'].append({
@@ -54,23 +231,104 @@ class JsonSchemaValidator:
                 'path': '.'.join(str(p) for p in e.path) if e.path else '',
                 'schema_path': '.'.join(str(p) for p in e.schema_path) if e.schema_path else ''
             })
-            self.logger.warning(f"JSON validation failed: {str(e)}")
+            self.logger.warning("JSON validation failed: %s", e)
         
         return result
     
-    def _load_schema(self, schema_path: str) -> Dict[str, Any]:
+    def _build_validator(self, schema: Dict[str, Any]) -> Any:
+        """
+        Check a schema once and build a reusable validator for it.
+        
+        Args:
+            schema: JSON schema
+            
+        Returns:
+            Validator: jsonschema validator instance for the schema's draft
+            
+        Raises:
+            jsonschema.exceptions.SchemaError: If schema is invalid
+        """
+        validator_class = jsonschema.validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        
+        # Shallow type/required schemas skip the generic validator entirely
+        if _TrivialSchemaValidator.handles(schema):
+            return _TrivialSchemaValidator(schema, validator_class.TYPE_CHECKER)
+        return validator_class(schema)
+    
+    def _get_inline_validator(self, schema: Dict[str, Any]) -> Tuple[Optional[bytes], Any]:
         """
-        Load JSON schema from file.
+        Get the compiled validator for a schema passed as a dictionary.
+        
+        Validators are keyed on a digest of the schema's content and built
+        from a private copy, so editing a schema dict in place between calls
+        gets a validator for its new content.
+        
+        Args:
+            schema: JSON schema
+            
+        Returns:
+            Tuple: Schema key (None if the schema is not cacheable) and validator
+        """
+        key = None
+        if _is_json_native(schema):
+            try:
+                key = hashlib.blake2b(_canonical_json(schema)).digest()
+            except (TypeError, ValueError):
+                pass
+        if key is None:
+            return None, self._build_validator(schema)
+        
+        validator = self._inline_validators.get(key)
+        if validator is not None:
+            self._inline_validators.move_to_end(key)
+            return key, validator
+        
+        validator = self._build_validator(copy.deepcopy(schema))
+        self._inline_validators[key] = validator
+        if len(self._inline_validators) > _MAX_INLINE_VALIDATORS:
+            self._inline_validators.popitem(last=False)
+        return key, validator
+    
+    def _result_cache_key(self, schema_key: Optional[Union[str, bytes]], data: Any) -> Optional[Tuple[Union[str, bytes], bytes]]:
+        """
+        Get the result cache key for validating data against a schema.
+        
+        The key holds a fixed-size digest of the canonical data, so cached
+        entries do not keep copies of the payloads alive.
+        
+        Args:
+            schema_key: Schema file path or inline schema content digest (None if not cacheable)
+            data: Data to validate
+            
+        Returns:
+            Tuple or None: Cache key, or None if caching is disabled or data is
+                not made of JSON-native values only
+        """
+        if self.result_cache_size <= 0 or schema_key is None or not _is_json_native(data):
+            return None
+        
+        try:
+            canonical = _canonical_json(data)
+        except (TypeError, ValueError):
+            return None
+        
+        return (schema_key, hashlib.blake2b(canonical).digest())
+    
+    def _load_schema(self, schema_path: str) -> Tuple[Dict[str, Any], Any]:
+        """
+        Load JSON schema from file and compile its validator.
         
         Args:
             schema_path: Path to schema file
             
         Returns:
-            Dict: JSON schema
+            Tuple: JSON schema and its compiled validator
             
         Raises:
             FileNotFoundError: If schema file is not found
-            json.JSONDecodeError: If schema file is not valid JSON
+            ValueError: If schema file is not valid JSON
+            jsonschema.exceptions.SchemaError: If schema is invalid
         """
         # Check if schema is already cached
         if schema_path in self.schema_cache:
@@ -85,14 +343,14 @@ class JsonSchemaValidator:
             full_path = schema_path
         
         try:
-            with open(full_path, 'r') as f:
-                schema = json.load(f)
-                self.schema_cache[schema_path] = schema
-                self.logger.info(f"Loaded JSON schema from {full_path}")
-                return schema
+            with open(full_path, 'rb') as f:
+                schema = _json_loads(f.read())
+                self.schema_cache[schema_path] = (schema, self._build_validator(schema))
+                self.logger.info("Loaded JSON schema from %s", full_path)
+                return self.schema_cache[schema_path]
         except FileNotFoundError:
-            self.logger.error(f"Schema file not found: {full_path}")
+            self.logger.error("Schema file not found: %s", full_path)
             raise
-        except json.JSONDecodeError as e:
-            self.logger.error(f"Invalid JSON schema file: {full_path} - {str(e)}")
+        except ValueError as e:
+            self.logger.error("Invalid JSON schema file: %s - %s", full_path, e)
             raise
@@ -3,52 +3,149 @@ Validators for API testing.
 """
 import re
 import logging
-from typing import Dict, Any, Optional, List, Union, Callable
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple, Union, Callable, Collection
+from jsonpath_ng.ext import parse as _jp_parse
+
+# google-re2 matches in linear time, so user-supplied header patterns cannot
+# backtrack catastrophically; it is optional and only used when requested
+# with Validators(regex_engine='re2')
+try:
+    import re2
+    _RE2_OPTIONS = re2.Options()
+    _RE2_OPTIONS.log_errors = False
+except (ImportError, AttributeError):
+    # Not installed, or an re2 binding other than google-re2
+    re2 = None
+
+# numpy is only needed for batch validation of recorded response times
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+@lru_cache(maxsize=512)
+def _parse_jsonpath(json_path: str):
+    """
+    Parse a JSONPath expression, caching the result.
+    
+    Args:
+        json_path: JSONPath expression
+        
+    Returns:
+        JSONPath: Parsed expression
+    """
+    return _jp_parse(json_path)
+
+# Regex engines accepted by Validators(regex_engine=...)
+_REGEX_ENGINES = ('re', 're2')
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str, use_re2: bool = False):
+    """
+    Compile a header value pattern, caching the result.
+    
+    With use_re2, patterns re2 cannot compile (backreferences, lookaround
+    and other non-regular constructs) fall back to the re module.
+    
+    Args:
+        pattern: Regex pattern
+        use_re2: Compile with re2 where possible (default: False)
+        
+    Returns:
+        Pattern: Compiled pattern with a re-compatible match() method
+    """
+    if use_re2:
+        try:
+            return re2.compile(pattern, options=_RE2_OPTIONS)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+# Batch log message templates, formatted by the logger only when the level is enabled
+_MSG_TIMES_OK = "All %d response times are within limit of %.3fs"
+_MSG_TIMES_FAIL = "%d of %d response times exceed limit of %.3fs"
+
+# Validators return plain dicts: 'valid' and 'message', plus whichever of
+# 'actual', 'expected', 'header_name', 'json_path' and 'pattern' apply
+ValidationResult = Dict[str, Any]
 
 class Validators:
     """Collection of validators for API responses."""
     
-    def __init__(self):
-        """Initialize the validators."""
+    __slots__ = ('logger', '_log_info', '_log_warn', 'regex_engine', '_use_re2')
+    
+    def __init__(self, regex_engine: str = 're'):
+        """
+        Initialize the validators.
+        
+        Args:
+            regex_engine: Engine for header patterns, 're' (default) or 're2'.
+                re2 runs in linear time but does not match exactly like re;
+                see validate_header
+                
+        Raises:
+            ValueError: If regex_engine is not 're' or 're2'
+            ImportError: If regex_engine is 're2' and google-re2 is not installed
+        """
+        if regex_engine not in _REGEX_ENGINES:
+            raise ValueError(f"Unknown regex engine {regex_engine!r}, expected one of {_REGEX_ENGINES}")
+        if regex_engine == 're2' and re2 is None:
+            raise ImportError("google-re2 is required for regex_engine='re2'")
+        self.regex_engine = regex_engine
+        self._use_re2 = regex_engine == 're2'
         self.logger = logging.getLogger(__name__)
+        # Bound once; every validation logs through one of these
+        self._log_info = self.logger.info
+        self._log_warn = self.logger.warning
     
-    def validate_status_code(self, response, expected_status: Union[int, List[int]]) -> Dict[str, Any]:
+    def validate_status_code(self, response, expected_status: Union[int, Collection[int]]) -> ValidationResult:
         """
         Validate response status code.
         
         Args:
             response: Response object
-            expected_status: Expected status code or list of valid status codes
+            expected_status: Expected status code or collection of valid status codes;
+                pass a set or frozenset for long allow-lists to get hashed lookups
             
         Returns:
             Dict: Validation result with 'valid' and 'message' keys
         """
+        actual_status = response.status_code
+        
         if isinstance(expected_status, int):
-            expected_status = [expected_status]
+            # Common single-status case: a direct compare, no wrapping list
+            is_valid = actual_status == expected_status
+        else:
+            # Membership is tested against the collection as given (no per-call
+            # conversion), so a set allow-list is checked in constant time
+            is_valid = actual_status in expected_status
         
-        actual_status = response.status_code
-        is_valid = actual_status in expected_status
+        if is_valid:
+            message = f"Status code {actual_status} matches expected {expected_status}"
+            self._log_info(message)
+        else:
+            message = f"Status code {actual_status} does not match expected {expected_status}"
+            self._log_warn(message)
         
-        result = {
+        return {
             'valid': is_valid,
+            'message': message,
             'actual': actual_status,
             'expected': expected_status
         }
-        
-        if is_valid:
-            result['message'] = f"Status code {actual_status} matches expected {expected_status}"
-            self.logger.info(result['message'])
-        else:
-            result['message'] = f"Status code {actual_status} does not match expected {expected_status}"
-            self.logger.warning(result['message'])
-        
-        return result
     
     def validate_header(self, response, header_name: str, expected_value: Optional[str] = None, 
-                       pattern: Optional[str] = None) -> Dict[str, Any]:
+                       pattern: Optional[str] = None) -> ValidationResult:
         """
         Validate response header.
         
+        The pattern is matched with re.match by default. With
+        regex_engine='re2' it is matched by re2 where re2 can compile it,
+        which differs from re: \\d, \\w, \\s and \\b are ASCII-only (r'\\d+$'
+        does not match '١٢٣'), and $ only matches at the very end, not
+        before a trailing newline.
+        
         Args:
             response: Response object
             header_name: Header name to validate
@@ -58,57 +155,103 @@ class Validators:
         Returns:
             Dict: Validation result with 'valid' and 'message' keys
         """
-        header_value = response.get_header(header_name)
-        
-        result = {
-            'valid': False,
-            'header_name': header_name,
-            'actual': header_value
-        }
+        return self._check_header(response.get_header(header_name), header_name, expected_value, pattern)
+    
+    def _check_header(self, header_value: Optional[str], header_name: str, expected_value: Optional[str] = None,
+                      pattern: Optional[str] = None, compiled_pattern: Any = None) -> ValidationResult:
+        """
+        Validate a header value already read from the response.
         
+        Args:
+            header_value: Header value, or None if the header is missing
+            header_name: Header name to validate
+            expected_value: Expected header value (optional)
+            pattern: Regex pattern to match header value (optional)
+            compiled_pattern: Pre-compiled pattern (optional, compiled from pattern if omitted)
+            
+        Returns:
+            Dict: Validation result with 'valid' and 'message' keys
+        """
         # Check if header exists
         if header_value is None:
-            result['message'] = f"Header '{header_name}' not found in response"
-            self.logger.warning(result['message'])
-            return result
+            message = f"Header '{header_name}' not found in response"
+            self._log_warn(message)
+            return {
+                'valid': False,
+                'message': message,
+                'actual': header_value,
+                'header_name': header_name
+            }
         
         # If expected value is provided, check exact match
         if expected_value is not None:
-            result['expected'] = expected_value
-            result['valid'] = header_value == expected_value
+            is_valid = header_value == expected_value
             
-            if result['valid']:
-                result['message'] = f"Header '{header_name}' value '{header_value}' matches expected '{expected_value}'"
-                self.logger.info(result['message'])
+            if is_valid:
+                message = f"Header '{header_name}' value '{header_value}' matches expected '{expected_value}'"
+                self._log_info(message)
             else:
-                result['message'] = f"Header '{header_name}' value '{header_value}' does not match expected '{expected_value}'"
-                self.logger.warning(result['message'])
+                message = f"Header '{header_name}' value '{header_value}' does not match expected '{expected_value}'"
+                self._log_warn(message)
             
-            return result
+            return {
+                'valid': is_valid,
+                'message': message,
+                'actual': header_value,
+                'expected': expected_value,
+                'header_name': header_name
+            }
         
         # If pattern is provided, check regex match
         if pattern is not None:
-            result['pattern'] = pattern
-            result['valid'] = bool(re.match(pattern, header_value))
-            
-            if result['valid']:
-                result['message'] = f"Header '{header_name}' value '{header_value}' matches pattern '{pattern}'"
-                self.logger.info(result['message'])
-            else:
-                result['message'] = f"Header '{header_name}' value '{header_value}' does not match pattern '{pattern}'"
-                self.logger.warning(result['message'])
-            
-            return result
+            if compiled_pattern is None:
+                compiled_pattern = _compile_pattern(pattern, self._use_re2)
+            is_valid = compiled_pattern.match(header_value) is not None
+            return self._pattern_result(header_name, header_value, pattern, is_valid)
         
         # If neither expected value nor pattern is provided, just check existence
-        result['valid'] = True
-        result['message'] = f"Header '{header_name}' exists in response"
-        self.logger.info(result['message'])
+        message = f"Header '{header_name}' exists in response"
+        self._log_info(message)
         
-        return result
+        return {
+            'valid': True,
+            'message': message,
+            'actual': header_value,
+            'header_name': header_name
+        }
+    
+    def _pattern_result(self, header_name: str, header_value: str, pattern: str,
+                        is_valid: bool) -> ValidationResult:
+        """
+        Build the result of matching a header value against a pattern.
+        
+        Args:
+            header_name: Validated header name
+            header_value: Header value
+            pattern: Regex pattern the value was matched against
+            is_valid: Whether the value matched
+            
+        Returns:
+            Dict: Validation result with 'valid' and 'message' keys
+        """
+        
+        if is_valid:
+            message = f"Header '{header_name}' value '{header_value}' matches pattern '{pattern}'"
+            self._log_info(message)
+        else:
+            message = f"Header '{header_name}' value '{header_value}' does not match pattern '{pattern}'"
+            self._log_warn(message)
+        
+        return {
+            'valid': is_valid,
+            'message': message,
+            'actual': header_value,
+            'header_name': header_name,
+            'pattern': pattern
+        }
     
     def validate_json_path(self, response, json_path: str, expected_value: Optional[Any] = None,
-                          validator: Optional[Callable] = None) -> Dict[str, Any]:
+                          validator: Optional[Callable] = None, all_matches: bool = False) -> ValidationResult:
         """
         Validate value at JSON path in response.
         
@@ -117,78 +260,185 @@ class Validators:
             json_path: JSONPath expression
             expected_value: Expected value at path (optional)
             validator: Custom validator function (optional)
+            all_matches: Validate the list of all matched values instead of
+                the first match (default: False)
             
         Returns:
             Dict: Validation result with 'valid' and 'message' keys
         """
         try:
-            # Import jsonpath-ng
-            from jsonpath_ng import parse
+            data = response.json
+        except Exception as e:
+            return self._json_path_error(json_path, e)
+        
+        return self._check_json_path(data, json_path, expected_value, validator, all_matches)
+    
+    def validate_json_paths(self, response, specs: List[Tuple[str, Any]]) -> List[ValidationResult]:
+        """
+        Validate values at several JSON paths in one response.
+        
+        The response body is read once and shared by every path.
+        
+        Args:
+            response: Response object
+            specs: (json_path, expected_value) pairs; an expected value of None
+                only checks that the path exists
             
-            # Parse JSON path expression
-            jsonpath_expr = parse(json_path)
+        Returns:
+            List: Validation results, in the same order as specs
+        """
+        try:
+            data = response.json
+        except Exception as e:
+            return [self._json_path_error(json_path, e) for json_path, _ in specs]
+        
+        return [
+            self._check_json_path(data, json_path, expected_value)
+            for json_path, expected_value in specs
+        ]
+    
+    def _check_json_path(self, data: Any, json_path: str, expected_value: Optional[Any] = None,
+                         validator: Optional[Callable] = None, all_matches: bool = False,
+                         jsonpath_expr: Any = None) -> ValidationResult:
+        """
+        Validate value at JSON path in already parsed JSON data.
+        
+        Args:
+            data: Parsed JSON data
+            json_path: JSONPath expression
+            expected_value: Expected value at path (optional)
+            validator: Custom validator function (optional)
+            all_matches: Validate the list of all matched values (default: False)
+            jsonpath_expr: Pre-parsed expression (optional, parsed from json_path if omitted)
             
-            # Find matches in response JSON
-            matches = jsonpath_expr.find(response.json)
+        Returns:
+            Dict: Validation result with 'valid' and 'message' keys
+        """
+        try:
+            # Parse JSON path expression (cached across calls)
+            if jsonpath_expr is None:
+                jsonpath_expr = _parse_jsonpath(json_path)
             
-            result = {
-                'valid': False,
-                'json_path': json_path
-            }
+            # Find matches in the JSON data (jsonpath-ng always collects every
+            # match, so there is no early exit for the first-match case)
+            matches = jsonpath_expr.find(data)
             
             # Check if path exists
             if not matches:
-                result['message'] = f"JSON path '{json_path}' not found in response"
-                self.logger.warning(result['message'])
-                return result
+                message = f"JSON path '{json_path}' not found in response"
+                self._log_warn(message)
+                return {
+                    'valid': False,
+                    'message': message,
+                    'json_path': json_path
+                }
             
-            # Get the first match value
-            actual_value = matches[0].value
-            result['actual'] = actual_value
+            # Get the first match value, or all of them if requested
+            if all_matches:
+                actual_value = [match.value for match in matches]
+            else:
+                actual_value = matches[0].value
             
             # If expected value is provided, check exact match
             if expected_value is not None:
-                result['expected'] = expected_value
-                result['valid'] = actual_value == expected_value
+                is_valid = actual_value == expected_value
                 
-                if result['valid']:
-                    result['message'] = f"Value at '{json_path}' matches expected '{expected_value}'"
-                    self.logger.info(result['message'])
+                if is_valid:
+                    message = f"Value at '{json_path}' matches expected '{expected_value}'"
+                    self._log_info(message)
                 else:
-                    result['message'] = f"Value at '{json_path}' is '{actual_value}', does not match expected '{expected_value}'"
-                    self.logger.warning(result['message'])
+                    message = f"Value at '{json_path}' is '{actual_value}', does not match expected '{expected_value}'"
+                    self._log_warn(message)
                 
-                return result
+                return {
+                    'valid': is_valid,
+                    'message': message,
+                    'actual': actual_value,
+                    'expected': expected_value,
+                    'json_path': json_path
+                }
             
             # If validator function is provided, use it
             if validator is not None:
-                result['valid'] = validator(actual_value)
+                is_valid = validator(actual_value)
                 
-                if result['valid']:
-                    result['message'] = f"Value at '{json_path}' passes custom validation"
-                    self.logger.info(result['message'])
+                if is_valid:
+                    message = f"Value at '{json_path}' passes custom validation"
+                    self._log_info(message)
                 else:
-                    result['message'] = f"Value at '{json_path}' fails custom validation"
-                    self.logger.warning(result['message'])
+                    message = f"Value at '{json_path}' fails custom validation"
+                    self._log_warn(message)
                 
-                return result
+                return {
+                    'valid': is_valid,
+                    'message': message,
+                    'actual': actual_value,
+                    'json_path': json_path
+                }
             
             # If neither expected value nor validator is provided, just check existence
-            result['valid'] = True
-            result['message'] = f"JSON path '{json_path}' exists in response"
-            self.logger.info(result['message'])
+            message = f"JSON path '{json_path}' exists in response"
+            self._log_info(message)
             
-            return result
-            
-        except Exception as e:
-            self.logger.error(f"Error validating JSON path: {str(e)}")
             return {
-                'valid': False,
-                'json_path': json_path,
-                'message': f"Error validating JSON path: {str(e)}"
+                'valid': True,
+                'message': message,
+                'actual': actual_value,
+                'json_path': json_path
             }
+            
+        except Exception as e:
+            return self._json_path_error(json_path, e)
     
-    def validate_response_time(self, response, max_time: float) -> Dict[str, Any]:
+    def _json_path_error(self, json_path: str, error: Exception) -> ValidationResult:
+        """
+        Build the result for a JSON path that could not be validated.
+        
+        Args:
+            json_path: JSONPath expression
+            error: Exception raised while validating
+            
+        Returns:
+            Dict: Failed validation result
+        """
+        message = f"Error validating JSON path: {error}"
+        self.logger.error(message)
+        return {
+            'valid': False,
+            'message': message,
+            'json_path': json_path
+        }
+    
+    def compile(self, specs: List[Dict[str, Any]]) -> List[Union['CompiledJsonPathValidator', 'CompiledHeaderValidator']]:
+        """
+        Compile validation specs once, for reuse across many responses.
+        
+        JSON paths are parsed and header patterns compiled here, so running
+        the compiled validators skips all of that per response.
+        
+        Args:
+            specs: Validation specs; a spec with 'json_path' takes the
+                validate_json_path arguments (expected_value, validator,
+                all_matches), one with 'header_name' takes the validate_header
+                arguments (expected_value, pattern)
+            
+        Returns:
+            List: Compiled validators, each with a run(response) method
+            
+        Raises:
+            ValueError: If a spec has neither 'json_path' nor 'header_name'
+        """
+        compiled = []
+        for spec in specs:
+            if 'json_path' in spec:
+                compiled.append(CompiledJsonPathValidator(self, **spec))
+            elif 'header_name' in spec:
+                compiled.append(CompiledHeaderValidator(self, **spec))
+            else:
+                raise ValueError(f"Validation spec needs 'json_path' or 'header_name': {spec!r}")
+        return compiled
+    
+    def validate_response_time(self, response, max_time: float) -> ValidationResult:
         """
         Validate response time.
         
@@ -202,17 +452,271 @@ class Validators:
         actual_time = response.elapsed_time
         is_valid = actual_time <= max_time
         
-        result = {
+        if is_valid:
+            message = f"Response time {actual_time:.3f}s is within limit of {max_time:.3f}s"
+            self._log_info(message)
+        else:
+            message = f"Response time {actual_time:.3f}s exceeds limit of {max_time:.3f}s"
+            self._log_warn(message)
+        
+        return {
             'valid': is_valid,
+            'message': message,
             'actual': actual_time,
             'expected': f"<= {max_time}"
         }
+    
+    def validate_response_times_batch(self, elapsed_times: 'np.ndarray', max_time: float) -> 'np.ndarray':
+        """
+        Validate many recorded response times at once.
         
-        if is_valid:
-            result['message'] = f"Response time {actual_time:.3f}s is within limit of {max_time:.3f}s"
-            self.logger.info(result['message'])
+        The comparison runs as a single vectorized numpy operation, for load
+        tests that check thousands of timings against the same limit.
+        
+        Args:
+            elapsed_times: Response times in seconds (array or sequence of floats)
+            max_time: Maximum acceptable response time in seconds
+            
+        Returns:
+            np.ndarray: Boolean mask, True where the response time is within the limit
+            
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        if np is None:
+            raise ImportError("numpy is required for validate_response_times_batch")
+        
+        elapsed_times = np.asarray(elapsed_times, dtype=float)
+        within_limit = elapsed_times <= max_time
+        
+        failed = elapsed_times.size - np.count_nonzero(within_limit)
+        if failed:
+            self._log_warn(_MSG_TIMES_FAIL, failed, elapsed_times.size, max_time)
         else:
-            result['message'] = f"Response time {actual_time:.3f}s exceeds limit of {max_time:.3f}s"
-            self.logger.warning(result['message'])
+            self._log_info(_MSG_TIMES_OK, elapsed_times.size, max_time)
+        
+        return within_limit
+
+class CompiledJsonPathValidator:
+    """JSON path validation with its expression parsed once."""
+    
+    def __init__(
+        self,
+        validators: Validators,
+        json_path: str,
+        expected_value: Optional[Any] = None,
+        validator: Optional[Callable] = None,
+        all_matches: bool = False
+    ):
+        """
+        Initialize the compiled JSON path validator.
+        
+        Args:
+            validators: Validators instance used for logging and results
+            json_path: JSONPath expression
+            expected_value: Expected value at path (optional)
+            validator: Custom validator function (optional)
+            all_matches: Validate the list of all matched values (default: False)
+            
+        Raises:
+            Exception: If json_path is not a valid JSONPath expression
+        """
+        self._validators = validators
+        self.json_path = json_path
+        self.expected_value = expected_value
+        self.validator = validator
+        self.all_matches = all_matches
+        self._jsonpath_expr = _parse_jsonpath(json_path)
+    
+    def run(self, response) -> ValidationResult:
+        """
+        Validate the JSON path in a response.
+        
+        Args:
+            response: Response object
+            
+        Returns:
+            Dict: Validation result with 'valid' and 'message' keys
+        """
+        try:
+            data = response.json
+        except Exception as e:
+            return self._validators._json_path_error(self.json_path, e)
+        
+        return self._validators._check_json_path(
+            data,
+            self.json_path,
+            self.expected_value,
+            self.validator,
+            self.all_matches,
+            self._jsonpath_expr
+        )
+
+class CompiledHeaderValidator:
+    """Header validation with its value pattern compiled once."""
+    
+    def __init__(
+        self,
+        validators: Validators,
+        header_name: str,
+        expected_value: Optional[str] = None,
+        pattern: Optional[str] = None
+    ):
+        """
+        Initialize the compiled header validator.
+        
+        Args:
+            validators: Validators instance used for logging and results
+            header_name: Header name to validate
+            expected_value: Expected header value (optional)
+            pattern: Regex pattern to match header value (optional)
+            
+        Raises:
+            re.error: If pattern is not a valid regex
+        """
+        self._validators = validators
+        self.header_name = header_name
+        self.expected_value = expected_value
+        self.pattern = pattern
+        self._compiled_pattern = (
+            _compile_pattern(pattern, validators._use_re2) if pattern is not None else None
+        )
+    
+    def run(self, response) -> ValidationResult:
+        """
+        Validate the header in a response.
+        
+        Args:
+            response: Response object
+            
+        Returns:
+            Dict: Validation result with 'valid' and 'message' keys
+        """
+        return self._validators._check_header(
+            response.get_header(self.header_name),
+            self.header_name,
+            self.expected_value,
+            self.pattern,
+            self._compiled_pattern
+        )
+
+class HeaderPatternSet:
+    """
+    Header pattern rules matched together, one scan per header value.
+    
+    With Validators(regex_engine='re2'), all patterns registered for the
+    same header are compiled into one RE2 Set, so each header value is
+    scanned once no matter how many rules it has. With the default re
+    engine, and for patterns re2 cannot compile, each pattern is matched
+    on its own as in validate_header.
+    """
+    
+    def __init__(self, validators: Optional[Validators] = None):
+        """
+        Initialize the header pattern set.
+        
+        Args:
+            validators: Validators instance used for logging and results (optional)
+        """
+        self._validators = validators or Validators()
+        # (header_name, pattern) in registration order
+        self._rules = []
+        # Per header: (header_name, rule indices, re2 Set or None, {set id: rule index},
+        # [(rule index, compiled pattern)])
+        self._groups = None
+    
+    def add(self, header_name: str, pattern: str) -> int:
+        """
+        Register a pattern the header value must match.
+        
+        Args:
+            header_name: Header name (case-insensitive)
+            pattern: Regex pattern, anchored at the start like validate_header
+            
+        Returns:
+            int: Rule index, the position of its result in validate_all()
+        """
+        self._rules.append((header_name, pattern))
+        self._groups = None
+        return len(self._rules) - 1
+    
+    def finalize(self):
+        """
+        Compile the registered patterns.
+        
+        Called by validate_all() when needed; call it directly to pay the
+        compile cost up front.
+        
+        Raises:
+            re.error: If a pattern is not a valid regex
+        """
+        rules_by_header = {}
+        for index, (header_name, _) in enumerate(self._rules):
+            rules_by_header.setdefault(header_name.lower(), []).append(index)
+        
+        groups = []
+        for indices in rules_by_header.values():
+            pattern_set = re2.Set.MatchSet(_RE2_OPTIONS) if self._validators._use_re2 else None
+            set_ids = {}
+            fallback = []
+            
+            for index in indices:
+                pattern = self._rules[index][1]
+                if pattern_set is not None:
+                    try:
+                        set_ids[pattern_set.Add(pattern)] = index
+                        continue
+                    except re2.error:
+                        pass
+                fallback.append((index, _compile_pattern(pattern, self._validators._use_re2)))
+            
+            if set_ids:
+                pattern_set.Compile()
+            else:
+                pattern_set = None
+            
+            groups.append((self._rules[indices[0]][0], indices, pattern_set, set_ids, fallback))
+        
+        self._groups = groups
+    
+    def validate_all(self, response) -> List[ValidationResult]:
+        """
+        Validate every registered rule against a response.
+        
+        Args:
+            response: Response object
+            
+        Returns:
+            List: Validation results, in the order the rules were added
+        """
+        if self._groups is None:
+            self.finalize()
+        
+        validators = self._validators
+        rules = self._rules
+        results = [None] * len(rules)
+        
+        for lookup_name, indices, pattern_set, set_ids, fallback in self._groups:
+            header_value = response.get_header(lookup_name)
+            
+            if header_value is None:
+                for index in indices:
+                    header_name, pattern = rules[index]
+                    results[index] = validators._check_header(None, header_name, pattern=pattern)
+                continue
+            
+            if pattern_set is not None:
+                matched = pattern_set.Match(header_value) or ()
+                for set_id, index in set_ids.items():
+                    header_name, pattern = rules[index]
+                    results[index] = validators._pattern_result(
+                        header_name, header_value, pattern, set_id in matched
+                    )
+            
+            for index, compiled_pattern in fallback:
+                header_name, pattern = rules[index]
+                results[index] = validators._pattern_result(
+                    header_name, header_value, pattern, compiled_pattern.match(header_value) is not None
+                )
         
-        return result
+        return results